@@ -7,20 +7,46 @@ Author: Manus AI
 Date: January 30, 2026
 """
 
-import requests
-import json
+import requests_cache
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import time
 import sys
 import os
 
+import numpy as np
+
 # Add the current directory to path to import striker_engine_v3
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from striker_engine_v3 import StrikerEngineV3
+from rate_limit import TokenBucket
+from fast_json import dumps as json_dumps, loads as json_loads, response_json
+from file_io import atomic_write
+from log_setup import setup_logging
+
+log = logging.getLogger(__name__)
+
+# Stablecoins to exclude from scan results (lowercase symbols)
+_STABLECOINS = frozenset({
+    'usdt', 'usdc', 'dai', 'busd', 'tusd', 'usdp', 'gusd', 'frax',
+    'usdd', 'lusd', 'susd', 'eurs', 'usdx', 'usds', 'fdusd', 'pyusd',
+    'eurc', 'usd1', 'usde', 'usdy', 'usdtb', 'cusd', 'usdr', 'usdj',
+    'ustb', 'usdf', 'usd0', 'usda', 'ylds', 'ust', 'flexusd'
+})
+
+# HTTP response cache lives next to the scripts so cron/bot runs share it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
 
-# Import pandas for isna check
-import pandas as pd
+def _is_nan(x):
+    """True for None or float NaN (cheap stand-in for pd.isna on scalars)"""
+    return x is None or (isinstance(x, float) and x != x)
+
+
+def _column(coins, key):
+    """Numeric field of every coin as a float64 array (missing/None -> 0)"""
+    return np.fromiter((coin.get(key) or 0 for coin in coins), dtype=np.float64, count=len(coins))
 
 
 class AutomatedScanner:
@@ -33,79 +59,197 @@ class AutomatedScanner:
     5. Identifies top opportunities
     """
 
-    def __init__(self, top_n=250, min_score=95, check_regime=True):
+    # Max concurrent CoinGecko requests (throughput is capped by cg_bucket)
+    MAX_CONCURRENT_REQUESTS = 2
+
+    # Max coin ids per batched /coins/markets request
+    BULK_IDS_PER_REQUEST = 50
+
+    # Seconds a fetched market regime is reused (F&G updates at most daily)
+    REGIME_TTL = 600
+
+    def __init__(self, top_n=250, min_score=95, check_regime=True, verbose=False, fng_source=None):
         self.top_n = top_n
         self.min_score = min_score
         self.check_regime = check_regime
+        self.verbose = verbose  # Print per-coin filter diagnostics
         self.base_url = "https://api.coingecko.com/api/v3"
-        self.engine = StrikerEngineV3()
+        # One rate limiter for every CoinGecko call (free tier ~30/min)
+        self.cg_bucket = TokenBucket(rate=25, per=60)
+        # Cached for 60s (or per Cache-Control); serves stale data on 429/5xx
+        self.session = requests_cache.CachedSession(
+            os.path.join(CACHE_DIR, 'cg'),
+            backend='sqlite',
+            expire_after=60,
+            cache_control=True,
+            stale_if_error=True
+        )
+        # Engine reuses the same pooled session (and gets retries mounted on it)
+        self.engine = StrikerEngineV3(rate_limiter=self.cg_bucket, session=self.session)
+        self._detail_cache = {}  # coin id -> /coins/markets payload
+        self._price_history = {}  # coin id -> price history from /market_chart
+        self._regime_cache = None  # (expires_at, (regime, fng_value))
+        # Callable returning the F&G payload; lets a host process share its copy
+        self.fng_source = fng_source or self._fetch_fng
+        # Last known regime, used when the F&G API is unavailable
+        self.regime_path = os.path.join(CACHE_DIR, 'regime.json')
+
+    def _save_regime(self, regime, fng_value):
+        """Persist the last known regime (atomic replace)"""
+        os.makedirs(os.path.dirname(self.regime_path), exist_ok=True)
+        atomic_write(self.regime_path, json_dumps({
+            'regime': regime,
+            'fng_value': fng_value,
+            'timestamp': datetime.now().isoformat(timespec='seconds')
+        }))
+
+    def _load_regime(self):
+        """Last persisted regime as a dict (None if there isn't one)"""
+        try:
+            with open(self.regime_path, 'rb') as f:
+                return json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _fetch_fng(self):
+        """Latest Fear & Greed payload from alternative.me"""
+        fng_response = self.session.get("https://api.alternative.me/fng/?limit=1", timeout=10)
+        return response_json(fng_response)
 
     def get_market_regime(self):
-        """Get current market regime (BEAR/NEUTRAL/BULL)"""
+        """Get current market regime (BEAR/NEUTRAL/BULL), reused for REGIME_TTL seconds"""
+        if self._regime_cache is not None and time.monotonic() < self._regime_cache[0]:
+            regime, fng_value = self._regime_cache[1]
+            log.info("\nMarket Regime: %s (F&G: %s, cached)", regime, fng_value)
+            return regime, fng_value
+
         try:
             # Get Fear & Greed Index
-            fng_response = requests.get("https://api.alternative.me/fng/?limit=1", timeout=10)
-            fng_data = fng_response.json()
+            fng_data = self.fng_source()
             fng_value = int(fng_data['data'][0]['value'])
 
             # Simple regime classification
             if fng_value < 35:
                 regime = "BEAR"
-                score = fng_value
             elif fng_value < 65:
                 regime = "NEUTRAL"
-                score = fng_value
             else:
                 regime = "BULL"
-                score = fng_value
 
-            print(f"\nMarket Regime: {regime} (F&G: {fng_value})")
+            log.info("\nMarket Regime: %s (F&G: %s)", regime, fng_value)
+            self._regime_cache = (time.monotonic() + self.REGIME_TTL, (regime, fng_value))
+            try:
+                self._save_regime(regime, fng_value)
+            except OSError as e:
+                log.warning("  \u26a0 Could not save market regime: %s", e)
             return regime, fng_value
         except Exception as e:
-            print(f"\n\u26a0 Could not fetch market regime: {e}")
-            print("Proceeding with scan anyway...")
+            log.warning("\n\u26a0 Could not fetch market regime: %s", e)
+            last = self._load_regime()
+            if last:
+                log.info("Using last known regime from %s: %s (F&G: %s)",
+                         last['timestamp'], last['regime'], last['fng_value'])
+                return last['regime'], last['fng_value']
+            log.info("Proceeding with scan anyway...")
             return "UNKNOWN", None
 
+    def _fetch_page(self, page, per_page):
+        """Fetch a single page of the markets endpoint"""
+        url = f"{self.base_url}/coins/markets"
+        params = {
+            'vs_currency': 'aud',
+            'order': 'market_cap_desc',
+            'per_page': per_page,
+            'page': page,
+            'sparkline': False,
+            'price_change_percentage': '24h,7d,30d'
+        }
+        self.cg_bucket.acquire()
+        response = self.session.get(url, params=params, timeout=15)
+        response.raise_for_status()
+        return response_json(response)
+
     def fetch_top_coins(self):
-        """Fetch top N coins by market cap"""
-        print(f"Fetching top {self.top_n} coins...")
+        """Fetch top N coins by market cap (pages are fetched concurrently)"""
+        log.info("Fetching top %d coins...", self.top_n)
         coins = []
         per_page = 250
         pages = (self.top_n + per_page - 1) // per_page  # Ceiling division
 
-        for page in range(1, pages + 1):
+        # Cap in-flight requests to stay within the CoinGecko free tier
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS) as executor:
+            futures = [
+                executor.submit(self._fetch_page, page, per_page)
+                for page in range(1, pages + 1)
+            ]
+
+        # Collect in page order so market cap ranking is preserved
+        for page, future in enumerate(futures, 1):
+            try:
+                page_coins = future.result()
+                coins.extend(page_coins)
+                log.debug("  Page %d/%d: %d coins fetched", page, pages, len(page_coins))
+            except Exception as e:
+                log.warning("  Error fetching page %d: %s", page, e)
+                continue
+
+        # Limit to exactly top_n
+        coins = coins[:self.top_n]
+
+        # Same payload as /coins/markets?ids=..., so seed the detail cache
+        self._detail_cache = {coin['id']: coin for coin in coins}
+        log.info("\n\u2705 Total coins fetched: %d", len(coins))
+        return coins
+
+    def fetch_bulk_details(self, ids):
+        """
+        Fetch market details for many coins at once
+        Uses /coins/markets?ids=... in chunks of BULK_IDS_PER_REQUEST
+        instead of one request per coin. Cached details are reused.
+        """
+        missing = [coin_id for coin_id in ids if coin_id not in self._detail_cache]
+        chunk_size = self.BULK_IDS_PER_REQUEST
+
+        for start in range(0, len(missing), chunk_size):
+            chunk = missing[start:start + chunk_size]
             try:
                 url = f"{self.base_url}/coins/markets"
                 params = {
                     'vs_currency': 'aud',
-                    'order': 'market_cap_desc',
-                    'per_page': per_page,
-                    'page': page,
+                    'ids': ','.join(chunk),
+                    'per_page': len(chunk),
                     'sparkline': False,
                     'price_change_percentage': '24h,7d,30d'
                 }
-                response = requests.get(url, params=params, timeout=15)
+                self.cg_bucket.acquire()
+                response = self.session.get(url, params=params, timeout=15)
                 response.raise_for_status()
-                page_coins = response.json()
-                coins.extend(page_coins)
-                print(f"  Page {page}/{pages}: {len(page_coins)} coins fetched")
-                time.sleep(1.5)  # Rate limiting
+                for detail in response_json(response):
+                    self._detail_cache[detail['id']] = detail
             except Exception as e:
-                print(f"  Error fetching page {page}: {e}")
+                log.warning("  Error fetching details for %d coins: %s", len(chunk), e)
                 continue
 
-        # Limit to exactly top_n
-        coins = coins[:self.top_n]
-        print(f"\n\u2705 Total coins fetched: {len(coins)}")
-        return coins
+        return {
+            coin_id: self._detail_cache[coin_id]
+            for coin_id in ids if coin_id in self._detail_cache
+        }
+
+    def prefetch_price_history(self, ids, live_prices=None):
+        """
+        Fetch price history for all candidates in one concurrent pass
+        Requests overlap (throttled by cg_bucket) instead of running one per
+        scoring step. Coins with live_prices and today's bars cached on disk
+        need no request. Results are stored in self._price_history.
+        """
+        self._price_history = self.engine.fetch_histories(
+            ids, max_workers=self.MAX_CONCURRENT_REQUESTS, live_prices=live_prices
+        )
+        log.info("  Price history fetched for %d/%d coins", len(self._price_history), len(ids))
+        return self._price_history
 
     # Stablecoins to exclude from scan results
-    STABLECOINS = {
-        'usdt', 'usdc', 'dai', 'busd', 'tusd', 'usdp', 'gusd', 'frax',
-        'usdd', 'lusd', 'susd', 'eurs', 'usdx', 'usds', 'fdusd', 'pyusd',
-        'eurc', 'usd1', 'usde', 'usdy', 'usdtb', 'cusd', 'usdr', 'usdj',
-        'ustb', 'usdf', 'usd0', 'usda', 'ylds', 'ust', 'flexusd'
-    }
+    STABLECOINS = _STABLECOINS
 
     def apply_filters(self, coins):
         """
@@ -116,39 +260,53 @@ class AutomatedScanner:
         3. Extreme volatility filter (>50% 24h change)
         4. Low volume filter (volume/mcap < 0.01)
         """
-        print(f"\nApplying filters to {len(coins)} coins...")
-        filtered = []
-
-        for coin in coins:
-            # Filter 0: Stablecoin filter
-            symbol = (coin.get('symbol', '') or '').lower()
-            if symbol in self.STABLECOINS:
-                print(f"  \u274c {coin['name']}: Stablecoin (excluded)")
-                continue
-
-            # Filter 1: Extreme volatility (likely pump & dump)
-            change_24h = coin.get('price_change_percentage_24h', 0) or 0
-            if abs(change_24h) > 50:
-                print(f"  \u274c {coin['name']}: Extreme volatility ({change_24h:.1f}%)")
-                continue
-
-            # Filter 2: Low volume
-            volume = coin.get('total_volume', 0) or 0
-            market_cap = coin.get('market_cap', 1) or 1
-            volume_ratio = volume / market_cap if market_cap > 0 else 0
-            if volume_ratio < 0.01:
-                print(f"  \u274c {coin['name']}: Low volume (V/MC: {volume_ratio:.4f})")
-                continue
-
-            # Filter 3: Overbought will be checked during scoring (RSI >70)
-            # For now, use 24h change as proxy
-            if change_24h > 30:
-                print(f"  \u26a0 {coin['name']}: Likely overbought (+{change_24h:.1f}%)")
-                # Don't skip yet, let technical analysis confirm
-
-            filtered.append(coin)
-
-        print(f"\n\u2705 Coins after filtering: {len(filtered)}")
+        log.info("\nApplying filters to %d coins...", len(coins))
+        if not coins:
+            log.info("\n\u2705 Coins after filtering: 0")
+            return []
+
+        # Filter 0: Stablecoin filter
+        is_stablecoin = np.fromiter(
+            ((coin.get('symbol') or '').lower() in _STABLECOINS for coin in coins),
+            dtype=bool, count=len(coins)
+        )
+
+        # Filter 1: Extreme volatility (likely pump & dump)
+        change_24h = _column(coins, 'price_change_percentage_24h')
+        is_volatile = np.abs(change_24h) > 50
+
+        # Filter 2: Low volume (missing/zero mcap -> 1)
+        volume = _column(coins, 'total_volume')
+        market_cap = _column(coins, 'market_cap')
+        volume_ratio = volume / np.where(market_cap == 0, 1, market_cap)
+        is_low_volume = volume_ratio < 0.01
+
+        # Attribute each rejection to the first filter it fails
+        is_volatile &= ~is_stablecoin
+        is_low_volume &= ~(is_stablecoin | is_volatile)
+        keep = ~(is_stablecoin | is_volatile | is_low_volume)
+
+        # Filter 3: Overbought will be checked during scoring (RSI >70)
+        # 24h change is only used as a proxy warning here
+        # Per-coin diagnostics are DEBUG (INFO with verbose) and skipped when disabled
+        level = logging.INFO if self.verbose else logging.DEBUG
+        if log.isEnabledFor(level):
+            for i, coin in enumerate(coins):
+                if is_stablecoin[i]:
+                    log.log(level, "  \u274c %s: Stablecoin (excluded)", coin['name'])
+                elif is_volatile[i]:
+                    log.log(level, "  \u274c %s: Extreme volatility (%.1f%%)", coin['name'], change_24h[i])
+                elif is_low_volume[i]:
+                    log.log(level, "  \u274c %s: Low volume (V/MC: %.4f)", coin['name'], volume_ratio[i])
+                elif change_24h[i] > 30:
+                    log.log(level, "  \u26a0 %s: Likely overbought (+%.1f%%)", coin['name'], change_24h[i])
+        log.info("  Excluded: %d stablecoins, %d extreme volatility, %d low volume",
+                 is_stablecoin.sum(), is_volatile.sum(), is_low_volume.sum())
+
+        # Keep the original dicts so downstream code sees untouched values
+        filtered = [coins[i] for i in np.flatnonzero(keep)]
+
+        log.info("\n\u2705 Coins after filtering: %d", len(filtered))
         return filtered
 
     def score_opportunities(self, coins, limit=20):
@@ -156,106 +314,127 @@ class AutomatedScanner:
         Score coins using Striker Engine V3
         Returns top N opportunities
         """
-        print(f"\nScoring top {limit} candidates...")
-        scored_coins = []
-
-        for i, coin in enumerate(coins[:limit], 1):
+        log.info("\nScoring top %d candidates...", limit)
+        candidates = coins[:limit]
+
+        # Prefetch market details and price history for all candidates
+        ids = [coin['id'] for coin in candidates]
+        details = self.fetch_bulk_details(ids)
+        live_prices = {coin_id: detail.get('current_price') for coin_id, detail in details.items()}
+        histories = self.prefetch_price_history(ids, live_prices=live_prices)
+
+        # Drop overbought coins (RSI >70) before paying for full scoring
+        to_score = []
+        overbought = errored = no_history = 0
+        for coin in candidates:
+            history = histories.get(coin['id'])
+            if history is None:
+                # Prefetch failed - retry once inline
+                history = self.engine.fetch_historical_prices(coin['id'], live_price=live_prices.get(coin['id']))
+                if history is None:
+                    # Still scored, with the neutral technical score (no further fetch)
+                    log.warning("  \u26a0 No price history for %s (neutral technical score)", coin['name'])
+                    no_history += 1
+                    to_score.append(coin)
+                    continue
+                histories[coin['id']] = history
             try:
-                print(f"\n[{i}/{limit}] Scoring {coin['name']}...")
-
-                # Score with Striker Engine V3
-                score, breakdown = self.engine.score_coin(coin)
-
-                # Check if overbought (RSI >70)
-                tech_indicators = breakdown.get('technical_indicators')
-                if tech_indicators and not pd.isna(tech_indicators.get('rsi')):
-                    rsi = tech_indicators['rsi']
-                    if rsi > 70:
-                        print(f"  \u26a0 OVERBOUGHT: RSI = {rsi:.1f} (skipping)")
-                        continue
-
-                scored_coins.append(breakdown)
-                time.sleep(6)  # Rate limiting (6s to stay under CoinGecko free tier)
+                rsi = self.engine.latest_rsi(history, coin_id=coin['id'])
             except Exception as e:
-                print(f"  \u274c Error scoring {coin['name']}: {e}")
+                log.warning("  \u274c Error checking RSI for %s: %s", coin['name'], e)
+                errored += 1
+                continue
+            if not _is_nan(rsi) and rsi > 70:
+                log.debug("  \u26a0 %s OVERBOUGHT: RSI = %.1f (skipping)", coin['name'], rsi)
+                overbought += 1
                 continue
+            to_score.append(coin)
+
+        # Score with Striker Engine V3 in one batch (RSI state is already up to date)
+        log.info("  Skipped %d overbought coins (RSI >70), %d errored; %d without price history",
+                 overbought, errored, no_history)
+        log.info("\nScoring %d coins...", len(to_score))
+        scored_coins = self.engine.score_coins_batch(
+            [details.get(coin['id'], coin) for coin in to_score], histories
+        )
+
+        # Keep RSI state so the next scan only processes new bars
+        try:
+            self.engine.save_indicator_state()
+        except OSError as e:
+            log.warning("  \u26a0 Could not save indicator state: %s", e)
 
         # Sort by score
         scored_coins.sort(key=lambda x: x['total_score'], reverse=True)
         return scored_coins
 
-    def generate_report(self, opportunities, market_regime=None):
-        """Generate scan report"""
+    def generate_report(self, opportunities, out, market_regime=None):
+        """Write the scan report to the text stream `out` line by line"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S AWST")
 
-        report = f"""
+        out.write(f"""
 ================================================================================
 AUTOMATED MARKET SCAN REPORT
 ================================================================================
 Scan Time: {timestamp}
 Coins Scanned: {self.top_n}
 Min Score Threshold: {self.min_score}/160
-"""
+""")
 
         if market_regime:
-            report += f"Market Regime: {market_regime}\n\n"
+            out.write(f"Market Regime: {market_regime}\n\n")
 
-        report += f"================================================================================\n"
-        report += f"TOP OPPORTUNITIES ({len(opportunities)} found)\n"
-        report += f"================================================================================\n"
+        out.write(f"================================================================================\n")
+        out.write(f"TOP OPPORTUNITIES ({len(opportunities)} found)\n")
+        out.write(f"================================================================================\n")
 
         for i, opp in enumerate(opportunities, 1):
-            report += f"#{i}. {opp['coin_name']} ({opp['symbol']})\n"
-            report += f"    Score: {opp['total_score']}/160\n"
-            report += f"    Price: ${opp['price']:.4f} AUD\n"
+            out.write(f"#{i}. {opp['coin_name']} ({opp['symbol']})\n")
+            out.write(f"    Score: {opp['total_score']}/160\n")
+            out.write(f"    Price: ${opp['price']:.4f} AUD\n")
             change_24h = opp.get('change_24h', 0) or 0
             change_7d = opp.get('change_7d', 0) or 0
-            report += f"    24h: {change_24h:+.2f}% | 7d: {change_7d:+.2f}%\n"
-            report += f"    Rank: #{opp['market_cap_rank']}\n"
-            report += f"\n"
-            report += f"    Breakdown:\n"
-            report += f"      - Technical: {opp['technical_score']}/60\n"
-            report += f"        {opp['technical_details']}\n"
-            report += f"      - Fundamental: {opp['fundamental_score']}/40\n"
-            report += f"        {opp['fundamental_details']}\n"
-            report += f"      - Catalyst: {opp['catalyst_score']}/40\n"
-            report += f"        {opp['catalyst_details']}\n"
-            report += f"      - Narrative: {opp['narrative_score']}/20\n"
-            report += f"        {opp['narrative_details']}\n"
-            report += f"\n"
+            out.write(f"    24h: {change_24h:+.2f}% | 7d: {change_7d:+.2f}%\n")
+            out.write(f"    Rank: #{opp['market_cap_rank']}\n")
+            out.write(f"\n")
+            out.write(f"    Breakdown:\n")
+            out.write(f"      - Technical: {opp['technical_score']}/60\n")
+            out.write(f"        {opp['technical_details']}\n")
+            out.write(f"      - Fundamental: {opp['fundamental_score']}/40\n")
+            out.write(f"        {opp['fundamental_details']}\n")
+            out.write(f"      - Catalyst: {opp['catalyst_score']}/40\n")
+            out.write(f"        {opp['catalyst_details']}\n")
+            out.write(f"      - Narrative: {opp['narrative_score']}/20\n")
+            out.write(f"        {opp['narrative_details']}\n")
+            out.write(f"\n")
 
             # Technical indicators
             tech = opp.get('technical_indicators')
             if tech:
-                report += f"    Technical Indicators:\n"
-                if not pd.isna(tech.get('rsi')):
-                    report += f"      - RSI: {tech['rsi']:.1f}\n"
-                if not pd.isna(tech.get('macd_diff')):
-                    report += f"      - MACD: {tech['macd_diff']:.2f}\n"
-                if not pd.isna(tech.get('bb_position')):
-                    report += f"      - BB Position: {tech['bb_position']:.2f}\n"
+                out.write(f"    Technical Indicators:\n")
+                if not _is_nan(tech.get('rsi')):
+                    out.write(f"      - RSI: {tech['rsi']:.1f}\n")
+                if not _is_nan(tech.get('macd_diff')):
+                    out.write(f"      - MACD: {tech['macd_diff']:.2f}\n")
+                if not _is_nan(tech.get('bb_position')):
+                    out.write(f"      - BB Position: {tech['bb_position']:.2f}\n")
 
-            report += f"\n{'='*40}\n\n"
+            out.write(f"\n{'='*40}\n\n")
 
         if len(opportunities) == 0:
-            report += "No opportunities found meeting criteria.\n"
-            report += "Consider lowering min_score threshold or waiting for better conditions.\n"
+            out.write("No opportunities found meeting criteria.\n")
+            out.write("Consider lowering min_score threshold or waiting for better conditions.\n")
 
-        report += f"================================================================================\n"
-        report += "END OF REPORT\n"
-        report += f"================================================================================\n"
-
-        return report
+        out.write(f"================================================================================\n")
+        out.write("END OF REPORT\n")
+        out.write(f"================================================================================\n")
 
     def run_scan(self):
         """Run complete scan"""
-        print("=" * 80)
-        print("AUTOMATED MARKET SCANNER V1.0")
-        print("=" * 80)
-        print(f"Timestamp: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}")
-        print(f"Coverage: Top {self.top_n} coins")
-        print(f"Min Score: {self.min_score}/160")
-        print("=" * 80)
+        log.info("%s\nAUTOMATED MARKET SCANNER V1.0\n%s\n"
+                 "Timestamp: %s\nCoverage: Top %d coins\nMin Score: %d/160\n%s",
+                 "=" * 80, "=" * 80, datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST'),
+                 self.top_n, self.min_score, "=" * 80)
 
         # Step 0: Check market regime (optional)
         regime = None
@@ -265,20 +444,20 @@ Min Score Threshold: {self.min_score}/160
 
             # Warn if BEAR market but continue
             if regime == "BEAR":
-                print(f"\n\u26a0 WARNING: Market in BEAR regime (F&G: {fng_value})")
-                print("Raising score threshold to 110+ for safety")
+                log.warning("\n\u26a0 WARNING: Market in BEAR regime (F&G: %s)\n"
+                            "Raising score threshold to 110+ for safety", fng_value)
                 self.min_score = max(self.min_score, 110)  # Raise threshold in bear market
 
         # Step 1: Fetch top coins
         coins = self.fetch_top_coins()
         if not coins:
-            print("\n\u274c Failed to fetch coins. Aborting scan.")
+            log.error("\n\u274c Failed to fetch coins. Aborting scan.")
             return None
 
         # Step 2: Apply filters
         filtered_coins = self.apply_filters(coins)
         if not filtered_coins:
-            print("\n\u274c No coins passed filters. Aborting scan.")
+            log.error("\n\u274c No coins passed filters. Aborting scan.")
             return None
 
         # Step 3: Score opportunities
@@ -290,31 +469,29 @@ Min Score Threshold: {self.min_score}/160
             if opp['total_score'] >= self.min_score
         ]
 
-        print(f"\n{'='*80}")
-        print(f"SCAN COMPLETE")
-        print(f"{'='*80}")
-        print(f"Total scanned: {len(coins)}")
-        print(f"After filters: {len(filtered_coins)}")
-        print(f"Scored: {len(scored_opportunities)}")
-        print(f"Qualified (>={self.min_score}): {len(qualified_opportunities)}")
-        print(f"{'='*80}\n")
-
-        # Step 5: Generate report
-        report = self.generate_report(qualified_opportunities)
+        log.info("\n%s\nSCAN COMPLETE\n%s\nTotal scanned: %d\nAfter filters: %d\n"
+                 "Scored: %d\nQualified (>=%d): %d\n%s\n",
+                 "=" * 80, "=" * 80, len(coins), len(filtered_coins), len(scored_opportunities),
+                 self.min_score, len(qualified_opportunities), "=" * 80)
 
-        # Save report
+        # Step 5: Stream report straight to disk
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = f"/home/ubuntu/Trading_Records/FY2025-2026/scans/scan_{timestamp}.txt"
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
         with open(report_path, 'w') as f:
-            f.write(report)
+            self.generate_report(qualified_opportunities, f)
+
+        # Machine-readable sidecar next to the text report
+        atomic_write(report_path[:-len('.txt')] + '.json', json_dumps(qualified_opportunities))
 
-        print(f"\u2705 Report saved: {report_path}\n")
-        print(report)
+        log.info("\u2705 Report saved: %s", report_path)
+        for i, opp in enumerate(qualified_opportunities, 1):
+            log.info("  #%d. %s (%s): %s/160", i, opp['coin_name'], opp['symbol'], opp['total_score'])
 
         return qualified_opportunities
 
 
 if __name__ == "__main__":
+    setup_logging()
     scanner = AutomatedScanner(top_n=250, min_score=95)
     opportunities = scanner.run_scan()
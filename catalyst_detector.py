@@ -9,12 +9,29 @@ Author: Manus AI
 Date: January 30, 2026
 """
 
-import requests
-import json
-from datetime import datetime, timedelta
-import time
+import requests_cache
+import sys
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
 import os
 
+from fast_json import response_json
+
+# HTTP response cache lives next to the scripts so cron/bot runs share it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+
+@dataclass(slots=True, frozen=True)
+class PostRef:
+    """Lightweight reference to a news post, shared by every coin it mentions"""
+    title: str
+    url: str
+    published_at: str
+    sentiment: str
+
 
 class CatalystDetector:
     """
@@ -26,9 +43,27 @@ class CatalystDetector:
     5. Alerts on significant catalyst clusters
     """
 
+    # CryptoPanic filters fetched (concurrently) for each detection run
+    NEWS_FILTERS = ('rising', 'hot', 'bullish', 'important')
+
+    # CryptoPanic free tier request quota
+    DAILY_REQUEST_QUOTA = 500
+
     def __init__(self, api_key=None):
         self.api_key = api_key or os.getenv('CRYPTOPANIC_API_KEY')
         self.base_url = "https://cryptopanic.com/api/developer/v2"
+        # News is cached for 5 minutes; auth_token is kept out of the cache keys
+        self.session = requests_cache.CachedSession(
+            os.path.join(CACHE_DIR, 'cryptopanic'),
+            backend='sqlite',
+            expire_after=300,
+            cache_control=True,
+            stale_if_error=True,
+            ignored_parameters=['auth_token']
+        )
+        # Network requests made today (cache hits are free)
+        self._budget = {'date': date.today(), 'used': 0}
+        self._budget_lock = threading.Lock()
 
         if not self.api_key:
             print("\u26a0 WARNING: No CryptoPanic API key found!")
@@ -36,6 +71,22 @@ class CatalystDetector:
             print("  Or sign up at: https://cryptopanic.com/developers/api/")
             print("  Free tier: 500 requests/day")
 
+    def _reserve_request(self):
+        """Take one request from today's CryptoPanic quota, returns its day (None if used up)"""
+        with self._budget_lock:
+            if self._budget['date'] != date.today():
+                self._budget = {'date': date.today(), 'used': 0}
+            if self._budget['used'] >= self.DAILY_REQUEST_QUOTA:
+                return None
+            self._budget['used'] += 1
+            return self._budget['date']
+
+    def _release_request(self, reserved_on):
+        """Give back a reservation that turned out to be a cache hit"""
+        with self._budget_lock:
+            if self._budget['date'] == reserved_on:
+                self._budget['used'] -= 1
+
     def fetch_recent_news(self, hours=48, filter_type='important'):
         """
         Fetch recent crypto news
@@ -48,6 +99,12 @@ class CatalystDetector:
             print("\u274c Cannot fetch news without API key")
             return []
 
+        # Reserved before the request so concurrent filters can't overshoot the quota
+        reserved_on = self._reserve_request()
+        if reserved_on is None:
+            print(f"\u274c Daily CryptoPanic quota used up, skipping '{filter_type}' news")
+            return []
+
         try:
             url = f"{self.base_url}/posts/"
             params = {
@@ -56,9 +113,11 @@ class CatalystDetector:
                 'public': 'true'
             }
 
-            response = requests.get(url, params=params, timeout=15)
+            response = self.session.get(url, params=params, timeout=15)
+            if getattr(response, 'from_cache', False):
+                self._release_request(reserved_on)
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
 
             posts = data.get('results', [])
 
@@ -70,12 +129,29 @@ class CatalystDetector:
             print(f"\u274c Error fetching news: {e}")
             return []
 
+    def fetch_news(self, hours=48, filter_types=NEWS_FILTERS):
+        """
+        Fetch several news filters concurrently and merge them
+        Posts returned by more than one filter are kept once (by post id)
+        """
+        with ThreadPoolExecutor(max_workers=len(filter_types)) as executor:
+            results = list(executor.map(
+                lambda filter_type: self.fetch_recent_news(hours=hours, filter_type=filter_type),
+                filter_types
+            ))
+
+        posts = {}
+        for filter_posts in results:
+            for post in filter_posts:
+                posts.setdefault(post.get('id') or post.get('url'), post)
+        return list(posts.values())
+
     def analyze_sentiment(self, posts):
         """
         Analyze sentiment of news posts
-        Returns: dict of {coin: {positive: count, negative: count, neutral: count, posts: []}}
+        Returns: dict of {coin: {'counts': Counter(positive/negative/neutral), 'posts': [PostRef]}}
         """
-        sentiment_map = {}
+        sentiment_map = defaultdict(lambda: {'counts': Counter(), 'posts': []})
 
         for post in posts:
             # Get coins mentioned (V2 uses 'instruments' instead of 'currencies')
@@ -94,26 +170,17 @@ class CatalystDetector:
             else:
                 sentiment = 'neutral'
 
+            post_ref = PostRef(post.get('title'), post.get('url'), post.get('published_at'), sentiment)
+
             # Update sentiment map
             for currency in currencies:
                 coin_code = currency.get('code', '').upper()
                 if coin_code:
-                    if coin_code not in sentiment_map:
-                        sentiment_map[coin_code] = {
-                            'positive': 0,
-                            'negative': 0,
-                            'neutral': 0,
-                            'posts': []
-                        }
-                    sentiment_map[coin_code][sentiment] += 1
-                    sentiment_map[coin_code]['posts'].append({
-                        'title': post.get('title'),
-                        'url': post.get('url'),
-                        'published_at': post.get('published_at'),
-                        'sentiment': sentiment
-                    })
-
-        return sentiment_map
+                    slot = sentiment_map[sys.intern(coin_code)]
+                    slot['counts'][sentiment] += 1
+                    slot['posts'].append(post_ref)
+
+        return dict(sentiment_map)
 
     def identify_catalysts(self, sentiment_map, min_positive=3):
         """
@@ -128,8 +195,9 @@ class CatalystDetector:
         catalysts = []
 
         for coin_code, data in sentiment_map.items():
-            positive_count = data['positive']
-            negative_count = data['negative']
+            counts = data['counts']
+            positive_count = counts['positive']
+            negative_count = counts['negative']
 
             # Filter: Must have at least min_positive positive news
             if positive_count < min_positive:
@@ -141,13 +209,13 @@ class CatalystDetector:
 
             # Calculate catalyst strength
             net_sentiment = positive_count - negative_count
-            total_news = positive_count + negative_count + data['neutral']
+            total_news = positive_count + negative_count + counts['neutral']
 
             catalyst = {
                 'coin': coin_code,
                 'positive_count': positive_count,
                 'negative_count': negative_count,
-                'neutral_count': data['neutral'],
+                'neutral_count': counts['neutral'],
                 'net_sentiment': net_sentiment,
                 'total_news': total_news,
                 'catalyst_strength': net_sentiment / total_news if total_news > 0 else 0,
@@ -161,49 +229,47 @@ class CatalystDetector:
 
         return catalysts
 
-    def generate_catalyst_report(self, catalysts):
-        """Generate catalyst detection report"""
+    def generate_catalyst_report(self, catalysts, out):
+        """Write the catalyst detection report to the text stream `out` line by line"""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S AWST")
 
-        report = f"""
+        out.write(f"""
 ================================================================================
 CATALYST DETECTION REPORT
 ================================================================================
 Scan Time: {timestamp}
 Catalysts Found: {len(catalysts)}
 ================================================================================
-"""
+""")
 
         if len(catalysts) == 0:
-            report += "No significant catalysts detected in the past 24 hours.\n"
+            out.write("No significant catalysts detected in the past 24 hours.\n")
         else:
-            report += f"================================================================================\n"
-            report += f"DETECTED CATALYSTS\n"
-            report += f"================================================================================\n"
+            out.write(f"================================================================================\n")
+            out.write(f"DETECTED CATALYSTS\n")
+            out.write(f"================================================================================\n")
 
             for i, catalyst in enumerate(catalysts, 1):
-                report += f"#{i}. {catalyst['coin']}\n"
-                report += f"    Catalyst Strength: {catalyst['catalyst_strength']:.0%}\n"
-                report += f"    Positive News: {catalyst['positive_count']}\n"
-                report += f"    Negative News: {catalyst['negative_count']}\n"
-                report += f"    Net Sentiment: +{catalyst['net_sentiment']}\n"
-                report += f"\n"
-                report += f"    Recent Headlines:\n"
+                out.write(f"#{i}. {catalyst['coin']}\n")
+                out.write(f"    Catalyst Strength: {catalyst['catalyst_strength']:.0%}\n")
+                out.write(f"    Positive News: {catalyst['positive_count']}\n")
+                out.write(f"    Negative News: {catalyst['negative_count']}\n")
+                out.write(f"    Net Sentiment: +{catalyst['net_sentiment']}\n")
+                out.write(f"\n")
+                out.write(f"    Recent Headlines:\n")
 
                 # Show top 3 positive posts
-                positive_posts = [p for p in catalyst['posts'] if p['sentiment'] == 'positive']
+                positive_posts = [p for p in catalyst['posts'] if p.sentiment == 'positive']
                 for j, post in enumerate(positive_posts[:3], 1):
-                    report += f"      {j}. {post['title']}\n"
-                    report += f"         {post['published_at']}\n"
-                    report += f"         {post['url']}\n"
+                    out.write(f"      {j}. {post.title}\n")
+                    out.write(f"         {post.published_at}\n")
+                    out.write(f"         {post.url}\n")
 
-                report += f"\n{'='*40}\n\n"
+                out.write(f"\n{'='*40}\n\n")
 
-        report += f"================================================================================\n"
-        report += "END OF REPORT\n"
-        report += f"================================================================================\n"
-
-        return report
+        out.write(f"================================================================================\n")
+        out.write("END OF REPORT\n")
+        out.write(f"================================================================================\n")
 
     def run_detection(self, hours=48, min_positive=2):
         """Run catalyst detection"""
@@ -226,7 +292,7 @@ Catalysts Found: {len(catalysts)}
 
         # Step 1: Fetch recent news
         print("\nFetching recent news...")
-        posts = self.fetch_recent_news(hours=hours, filter_type='rising')
+        posts = self.fetch_news(hours=hours)
         print(f"\u2705 Fetched {len(posts)} recent posts")
 
         if not posts:
@@ -243,18 +309,18 @@ Catalysts Found: {len(catalysts)}
         catalysts = self.identify_catalysts(sentiment_map, min_positive=min_positive)
         print(f"\u2705 Found {len(catalysts)} catalyst opportunities")
 
-        # Step 4: Generate report
-        report = self.generate_catalyst_report(catalysts)
-
-        # Save report
+        # Step 4: Stream report straight to disk
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_path = f"/home/ubuntu/Trading_Records/FY2025-2026/catalysts/catalyst_{timestamp}.txt"
         os.makedirs(os.path.dirname(report_path), exist_ok=True)
         with open(report_path, 'w') as f:
-            f.write(report)
+            self.generate_catalyst_report(catalysts, f)
 
-        print(f"\n\u2705 Report saved: {report_path}\n")
-        print(report)
+        print(f"\n\u2705 Report saved: {report_path}")
+        for i, catalyst in enumerate(catalysts, 1):
+            print(f"  #{i}. {catalyst['coin']}: strength {catalyst['catalyst_strength']:.0%}, "
+                  f"+{catalyst['net_sentiment']} net sentiment")
+        print()
 
         return catalysts
 
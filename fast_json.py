@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+FAST JSON V1.0
+JSON parsing and serialization backed by orjson when available
+
+Author: Manus AI
+Date: October 15, 2026
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to the stdlib json module
+    orjson = None
+
+
+def _default(obj):
+    """Serialize numpy scalars/arrays for the stdlib fallback"""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response):
+    """Parse a requests response body (faster drop-in for response.json())"""
+    return loads(response.content)
+
+
+def dumps(obj):
+    """Serialize to indented UTF-8 JSON bytes (numpy values supported)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_default).encode('utf-8')
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+FILE IO V1.0
+Single-shot atomic writes for small report and state files
+
+Author: Manus AI
+Date: October 15, 2026
+"""
+
+import os
+import threading
+
+
+def atomic_write(path, data):
+    """
+    Write data (str is UTF-8 encoded) to path in one go via a raw fd
+
+    Skips the TextIOWrapper/BufferedWriter layers for payloads that are
+    already fully formatted. The file is written next to path, synced and
+    renamed over it, so readers (or a restart after a crash) never see a
+    half-written file.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    # Unique per process and thread so concurrent writers never share a tmp file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]  # os.write may write less than asked
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+HEALTH CHECK V1.0
+HTTP health check endpoint for hosting platforms (Koyeb needs a response
+on PORT within seconds of start-up). Standard library only, so it can be
+started before anything heavy is imported.
+
+Author: Manus AI
+Date: October 15, 2026
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+log = logging.getLogger(__name__)
+
+# Perth time has no daylight saving, so a fixed offset is exact
+AWST = timezone(timedelta(hours=8), 'AWST')
+
+# (epoch second, formatted AWST time) - see now_awst()
+_ts_cache = (None, "")
+
+
+def now_awst():
+    """Current AWST time as 'YYYY-mm-dd HH:MM:SS AWST', formatted at most once per second"""
+    global _ts_cache
+    now = int(time.time())
+    second, formatted = _ts_cache
+    if second != now:
+        formatted = datetime.fromtimestamp(now, AWST).strftime('%Y-%m-%d %H:%M:%S AWST')
+        _ts_cache = (now, formatted)
+    return formatted
+
+
+# Fixed parts of the health check body, encoded once
+_HEALTH_PREFIX = b"Apex Predator Trading Bot - ONLINE\nTime: "
+_HEALTH_SUFFIX = b"\n"
+
+
+class HealthCheckHandler(BaseHTTPRequestHandler):
+    """Simple HTTP handler for health checks (keeps Koyeb happy)"""
+
+    # Keep-alive, so repeated probes can reuse one connection
+    protocol_version = "HTTP/1.1"
+    # Seconds an idle (or stalled) connection may hold its thread before it is closed
+    timeout = 10
+
+    # (AWST time string, body, Content-Length) - rebuilt when now_awst() ticks over
+    _cached = (None, b"", "0")
+
+    @classmethod
+    def _body(cls):
+        """Encoded body and its length, shared by all probes within the same second"""
+        formatted = now_awst()
+        cached = cls._cached
+        if cached[0] != formatted:
+            body = _HEALTH_PREFIX + formatted.encode() + _HEALTH_SUFFIX
+            cached = cls._cached = (formatted, body, str(len(body)))
+        return cached[1], cached[2]
+
+    def _send_headers(self, length):
+        """Status line and headers (Content-Length keeps the connection reusable)"""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/plain')
+        self.send_header('Content-Length', length)
+        self.end_headers()
+
+    def do_GET(self):
+        body, length = self._body()
+        self._send_headers(length)
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        # Same headers as GET, no body
+        self._send_headers(self._body()[1])
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_health_server():
+    """
+    Start a simple HTTP server for health checks
+    The port is bound and listening before this returns; requests are
+    served from a daemon thread. Returns None if the port can't be bound.
+    """
+    port = int(os.environ.get("PORT", 8000))
+    try:
+        # One thread per connection so overlapping probes never queue behind each other
+        server = ThreadingHTTPServer(('0.0.0.0', port), HealthCheckHandler)
+    except OSError as e:
+        log.error("\u274c Health check server could not bind port %d: %s", port, e)
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='health', daemon=True).start()
+    log.info("Health check server running on port %d", port)
+    return server
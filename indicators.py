@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+INDICATOR KERNELS V1.0
+RSI, MACD and Bollinger Band loops compiled with numba when available
+
+Each kernel reproduces the ta library output (same smoothing, same warmup
+NaNs) on a float64 numpy array of closes.
+
+Author: Manus AI
+Date: October 14, 2026
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional - fall back to plain Python loops
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _rsi_loop(close, n):
+    """Wilder RSI series (NaN until n observations, 100 when no losses)"""
+    out = np.full(close.shape[0], np.nan)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, close.shape[0]):
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (n - 1) + gain) / n
+        avg_loss = (avg_loss * (n - 1) + loss) / n
+        if i >= n - 1:
+            if avg_loss == 0:
+                out[i] = 100.0
+            else:
+                out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+@njit(cache=True)
+def _snapshot_loop(close, rsi_n=14, fast=12, slow=26, sign=9, bb_n=20, bb_k=2.0):
+    """
+    Last-bar RSI, MACD and Bollinger values in one fused pass
+
+    Same RSI smoothing as _rsi_loop, EMA (adjust=False) MACD and
+    population-std Bollinger Bands, without building full output series.
+    Returns (rsi, macd, macd_signal, macd_diff,
+    bb_upper, bb_lower, bb_middle); NaN where there is not enough data.
+    """
+    size = close.shape[0]
+    last = size - 1
+    alpha_fast = 2.0 / (fast + 1)
+    alpha_slow = 2.0 / (slow + 1)
+    alpha_sign = 2.0 / (sign + 1)
+    avg_gain = 0.0
+    avg_loss = 0.0
+    ema_fast = close[0]
+    ema_slow = close[0]
+    macd = np.nan
+    ema_sign = np.nan
+    for i in range(1, size):
+        # RSI: Wilder's smoothing
+        change = close[i] - close[i - 1]
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (avg_gain * (rsi_n - 1) + gain) / rsi_n
+        avg_loss = (avg_loss * (rsi_n - 1) + loss) / rsi_n
+
+        # MACD: fast/slow EMAs, signal EMA seeded with the first MACD value
+        ema_fast += alpha_fast * (close[i] - ema_fast)
+        ema_slow += alpha_slow * (close[i] - ema_slow)
+        if i >= slow - 1:
+            macd = ema_fast - ema_slow
+            if i == slow - 1:
+                ema_sign = macd
+            else:
+                ema_sign += alpha_sign * (macd - ema_sign)
+
+    rsi = np.nan
+    if last >= 1 and last >= rsi_n - 1:
+        if avg_loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    macd_signal = ema_sign if last >= slow + sign - 2 else np.nan
+
+    # Bollinger: only the final window is needed
+    bb_upper = np.nan
+    bb_lower = np.nan
+    bb_middle = np.nan
+    if size >= bb_n:
+        total = 0.0
+        for j in range(size - bb_n, size):
+            total += close[j]
+        bb_middle = total / bb_n
+        sq = 0.0
+        for j in range(size - bb_n, size):
+            sq += (close[j] - bb_middle) ** 2
+        std = np.sqrt(sq / bb_n)
+        bb_upper = bb_middle + bb_k * std
+        bb_lower = bb_middle - bb_k * std
+
+    return rsi, macd, macd_signal, macd - macd_signal, bb_upper, bb_lower, bb_middle
+
+
+def warmup():
+    """
+    Run every kernel once on dummy data so numba compiles (or loads its
+    on-disk cache) up front instead of during the first scored coin
+    """
+    close = np.linspace(1.0, 2.0, 40)
+    _rsi_loop(close, 14)
+    _snapshot_loop(close, 14, 12, 26, 9, 20, 2.0)
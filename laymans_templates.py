@@ -7,6 +7,59 @@ Author: Manus AI
 Date: January 30, 2026
 """
 
+from bisect import bisect_right
+
+# RSI buckets: a value below _RSI_BOUNDS[i] gets _RSI_TEMPLATES[i]
+_RSI_BOUNDS = (20, 30, 40, 60, 70, 80)
+_RSI_TEMPLATES = (
+    "RSI is {rsi:.0f} - Think of this like a store having a massive clearance sale. "
+    "The price has dropped so much that it might be a bargain, but there could be a reason "
+    "everyone's selling. Proceed with caution.",
+    "RSI is {rsi:.0f} - This is like finding a quality item on sale. "
+    "The price has come down enough that it could be a good entry point.",
+    "RSI is {rsi:.0f} - This is the sweet spot, like buying during a seasonal sale. "
+    "Not too cheap (suspicious) and not too expensive.",
+    "RSI is {rsi:.0f} - Fair price territory. Like buying at regular retail price. "
+    "Nothing special, but nothing wrong either.",
+    "RSI is {rsi:.0f} - Getting a bit pricey. Like buying something that's trending "
+    "and the price is starting to go up.",
+    "RSI is {rsi:.0f} - Overpriced territory. Like buying a hot item at a premium. "
+    "Most of the easy gains are probably gone.",
+    "RSI is {rsi:.0f} - Extremely overpriced. Like buying concert tickets from a scalper. "
+    "The smart money has already taken profits.",
+)
+
+# Score buckets: a score at or above the bound moves up one bucket
+_SCORE_BOUNDS = (80, 95, 110, 130)
+_SCORE_TEMPLATES = (
+    "Score: {score}/160 - BELOW AVERAGE. Like a 2-star review. "
+    "Probably best to look elsewhere.",
+    "Score: {score}/160 - AVERAGE. Like a 3-star hotel. "
+    "It'll do the job but nothing to write home about.",
+    "Score: {score}/160 - GOOD. Like a solid 4-star review. "
+    "Worth considering but do your own research too.",
+    "Score: {score}/160 - VERY GOOD. Like a restaurant with 4.5 stars. "
+    "Strong opportunity with minor concerns.",
+    "Score: {score}/160 - EXCELLENT. This is like finding a diamond in the rough. "
+    "Multiple indicators are all pointing in the same direction.",
+)
+
+# Regime explanations (anything unrecognised is described as BULL)
+_REGIME_TEMPLATES = {
+    "BEAR": "Market Regime: BEAR (Fear & Greed: {fng})\n"
+            "Think of this like winter for the market. People are scared and selling. "
+            "Like a housing market crash - prices are falling and everyone's nervous. "
+            "Be extra careful and only buy the absolute best opportunities.",
+    "NEUTRAL": "Market Regime: NEUTRAL (Fear & Greed: {fng})\n"
+               "Think of this like autumn/spring for the market. Neither hot nor cold. "
+               "Like a stable housing market - normal activity, normal prices. "
+               "Good time for selective buying.",
+    "BULL": "Market Regime: BULL (Fear & Greed: {fng})\n"
+            "Think of this like summer for the market. Everyone's excited and buying. "
+            "Like a booming housing market - prices going up, lots of activity. "
+            "Good time to trade but don't get greedy.",
+}
+
 
 class LaymansTemplates:
     """
@@ -17,66 +70,17 @@ class LaymansTemplates:
     @staticmethod
     def explain_rsi(rsi_value):
         """Explain RSI in layman's terms"""
-        if rsi_value < 20:
-            return f"RSI is {rsi_value:.0f} - Think of this like a store having a massive clearance sale. " \
-                   f"The price has dropped so much that it might be a bargain, but there could be a reason " \
-                   f"everyone's selling. Proceed with caution."
-        elif rsi_value < 30:
-            return f"RSI is {rsi_value:.0f} - This is like finding a quality item on sale. " \
-                   f"The price has come down enough that it could be a good entry point."
-        elif rsi_value < 40:
-            return f"RSI is {rsi_value:.0f} - This is the sweet spot, like buying during a seasonal sale. " \
-                   f"Not too cheap (suspicious) and not too expensive."
-        elif rsi_value < 60:
-            return f"RSI is {rsi_value:.0f} - Fair price territory. Like buying at regular retail price. " \
-                   f"Nothing special, but nothing wrong either."
-        elif rsi_value < 70:
-            return f"RSI is {rsi_value:.0f} - Getting a bit pricey. Like buying something that's trending " \
-                   f"and the price is starting to go up."
-        elif rsi_value < 80:
-            return f"RSI is {rsi_value:.0f} - Overpriced territory. Like buying a hot item at a premium. " \
-                   f"Most of the easy gains are probably gone."
-        else:
-            return f"RSI is {rsi_value:.0f} - Extremely overpriced. Like buying concert tickets from a scalper. " \
-                   f"The smart money has already taken profits."
+        return _RSI_TEMPLATES[bisect_right(_RSI_BOUNDS, rsi_value)].format(rsi=rsi_value)
 
     @staticmethod
     def explain_score(total_score):
         """Explain the total score in layman's terms"""
-        if total_score >= 130:
-            return f"Score: {total_score}/160 - EXCELLENT. This is like finding a diamond in the rough. " \
-                   f"Multiple indicators are all pointing in the same direction."
-        elif total_score >= 110:
-            return f"Score: {total_score}/160 - VERY GOOD. Like a restaurant with 4.5 stars. " \
-                   f"Strong opportunity with minor concerns."
-        elif total_score >= 95:
-            return f"Score: {total_score}/160 - GOOD. Like a solid 4-star review. " \
-                   f"Worth considering but do your own research too."
-        elif total_score >= 80:
-            return f"Score: {total_score}/160 - AVERAGE. Like a 3-star hotel. " \
-                   f"It'll do the job but nothing to write home about."
-        else:
-            return f"Score: {total_score}/160 - BELOW AVERAGE. Like a 2-star review. " \
-                   f"Probably best to look elsewhere."
+        return _SCORE_TEMPLATES[bisect_right(_SCORE_BOUNDS, total_score)].format(score=total_score)
 
     @staticmethod
     def explain_regime(regime, fng_value):
         """Explain market regime in layman's terms"""
-        if regime == "BEAR":
-            return f"Market Regime: BEAR (Fear & Greed: {fng_value})\n" \
-                   f"Think of this like winter for the market. People are scared and selling. " \
-                   f"Like a housing market crash - prices are falling and everyone's nervous. " \
-                   f"Be extra careful and only buy the absolute best opportunities."
-        elif regime == "NEUTRAL":
-            return f"Market Regime: NEUTRAL (Fear & Greed: {fng_value})\n" \
-                   f"Think of this like autumn/spring for the market. Neither hot nor cold. " \
-                   f"Like a stable housing market - normal activity, normal prices. " \
-                   f"Good time for selective buying."
-        else:
-            return f"Market Regime: BULL (Fear & Greed: {fng_value})\n" \
-                   f"Think of this like summer for the market. Everyone's excited and buying. " \
-                   f"Like a booming housing market - prices going up, lots of activity. " \
-                   f"Good time to trade but don't get greedy."
+        return _REGIME_TEMPLATES.get(regime, _REGIME_TEMPLATES["BULL"]).format(fng=fng_value)
 
 
 if __name__ == "__main__":
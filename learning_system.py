@@ -8,8 +8,10 @@ Date: January 30, 2026
 """
 
 import os
-import json
 from datetime import datetime
+from string import Template
+
+from file_io import atomic_write
 
 
 class LearningSystem:
@@ -21,24 +23,16 @@ class LearningSystem:
     4. Generates improvement suggestions
     """
 
-    def __init__(self):
-        self.journal_dir = "/home/ubuntu/Trading_Records/FY2025-2026/learning_journal"
-        os.makedirs(self.journal_dir, exist_ok=True)
-
-    def create_journal_entry(self, trade_data):
-        """Create a learning journal entry for a trade"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        coin = trade_data.get('coin', 'UNKNOWN')
-        
-        entry = f"""# Learning Journal: {coin}
-## Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}
+    # Journal entry layout, compiled once ($$ is a literal dollar sign)
+    _TMPL = Template("""# Learning Journal: $coin
+## Date: $date
 
 ### Trade Summary
-- **Coin:** {coin}
-- **Entry Price:** ${trade_data.get('entry_price', 'N/A')} AUD
-- **Exit Price:** ${trade_data.get('exit_price', 'N/A')} AUD
-- **P/L:** {trade_data.get('pnl', 'N/A')}%
-- **Score at Entry:** {trade_data.get('score', 'N/A')}/160
+- **Coin:** $coin
+- **Entry Price:** $$$entry_price AUD
+- **Exit Price:** $$$exit_price AUD
+- **P/L:** $pnl%
+- **Score at Entry:** $score/160
 
 ### What Went Right
 - [To be filled]
@@ -59,11 +53,29 @@ class LearningSystem:
 
 ---
 *Every trade is a lesson, win or lose.*
-"""
-        
+""")
+
+    def __init__(self):
+        self.journal_dir = "/home/ubuntu/Trading_Records/FY2025-2026/learning_journal"
+        os.makedirs(self.journal_dir, exist_ok=True)
+
+    def create_journal_entry(self, trade_data):
+        """Create a learning journal entry for a trade"""
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        coin = trade_data.get('coin', 'UNKNOWN')
+
+        entry = self._TMPL.safe_substitute(
+            coin=coin,
+            date=now.strftime('%Y-%m-%d %H:%M:%S AWST'),
+            entry_price=trade_data.get('entry_price', 'N/A'),
+            exit_price=trade_data.get('exit_price', 'N/A'),
+            pnl=trade_data.get('pnl', 'N/A'),
+            score=trade_data.get('score', 'N/A')
+        )
+
         filepath = os.path.join(self.journal_dir, f"journal_{coin}_{timestamp}.md")
-        with open(filepath, 'w') as f:
-            f.write(entry)
+        atomic_write(filepath, entry)
         
         print(f"\u2705 Learning journal created: {filepath}")
         return filepath
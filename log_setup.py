@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+LOG SETUP V1.0
+Queue-backed logging so console/file writes happen off the scanning threads
+
+Author: Manus AI
+Date: October 15, 2026
+"""
+
+import atexit
+import logging
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+_listener = None
+
+
+def setup_logging(level=logging.INFO, stream=None):
+    """
+    Route the root logger through a QueueHandler
+
+    Callers only enqueue records; a QueueListener thread formats and writes
+    them to `stream` (stdout by default). Safe to call more than once.
+    """
+    global _listener
+    if _listener is not None:
+        logging.getLogger().setLevel(level)
+        return _listener
+
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    root.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, handler)
+    _listener.start()
+    atexit.register(stop_logging)  # Flush queued records on exit
+    return _listener
+
+
+def stop_logging():
+    """Write out every queued record and stop the listener (for exits that skip atexit)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -9,6 +9,9 @@ Date: January 30, 2026
 
 import os
 from datetime import datetime
+from string import Template
+
+from file_io import atomic_write
 
 
 class ProgressReporter:
@@ -20,20 +23,13 @@ class ProgressReporter:
     4. Identifies trends and improvements
     """
 
-    def __init__(self):
-        self.reports_dir = "/home/ubuntu/Trading_Records/FY2025-2026/reports"
-        os.makedirs(self.reports_dir, exist_ok=True)
-
-    def generate_weekly_report(self):
-        """Generate weekly progress report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        report = f"""
+    # Report layouts, compiled once
+    _WEEKLY_TMPL = Template("""
 ================================================================================
 WEEKLY PROGRESS REPORT
 ================================================================================
-Week Ending: {datetime.now().strftime('%Y-%m-%d')}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}
+Week Ending: $week_ending
+Generated: $generated
 ================================================================================
 
 TRADING SUMMARY
@@ -57,25 +53,14 @@ NEXT WEEK FOCUS
 ================================================================================
 END OF REPORT
 ================================================================================
-"""
-        
-        filepath = os.path.join(self.reports_dir, f"weekly_{timestamp}.txt")
-        with open(filepath, 'w') as f:
-            f.write(report)
-        
-        print(f"\u2705 Weekly report saved: {filepath}")
-        return report
+""")
 
-    def generate_monthly_report(self):
-        """Generate monthly progress report"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        
-        report = f"""
+    _MONTHLY_TMPL = Template("""
 ================================================================================
 MONTHLY PROGRESS REPORT
 ================================================================================
-Month: {datetime.now().strftime('%B %Y')}
-Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}
+Month: $month
+Generated: $generated
 ================================================================================
 
 [Monthly report template - to be populated with actual data]
@@ -83,12 +68,41 @@ Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}
 ================================================================================
 END OF REPORT
 ================================================================================
-"""
-        
+""")
+
+    def __init__(self):
+        self.reports_dir = "/home/ubuntu/Trading_Records/FY2025-2026/reports"
+        os.makedirs(self.reports_dir, exist_ok=True)
+
+    def generate_weekly_report(self):
+        """Generate weekly progress report"""
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+        report = self._WEEKLY_TMPL.substitute(
+            week_ending=now.strftime('%Y-%m-%d'),
+            generated=now.strftime('%Y-%m-%d %H:%M:%S AWST')
+        )
+
+        filepath = os.path.join(self.reports_dir, f"weekly_{timestamp}.txt")
+        atomic_write(filepath, report)
+
+        print(f"\u2705 Weekly report saved: {filepath}")
+        return report
+
+    def generate_monthly_report(self):
+        """Generate monthly progress report"""
+        now = datetime.now()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+
+        report = self._MONTHLY_TMPL.substitute(
+            month=now.strftime('%B %Y'),
+            generated=now.strftime('%Y-%m-%d %H:%M:%S AWST')
+        )
+
         filepath = os.path.join(self.reports_dir, f"monthly_{timestamp}.txt")
-        with open(filepath, 'w') as f:
-            f.write(report)
-        
+        atomic_write(filepath, report)
+
         print(f"\u2705 Monthly report saved: {filepath}")
         return report
 
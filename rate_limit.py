@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+RATE LIMITER V1.0
+Token bucket shared by every module that calls the CoinGecko API
+
+Author: Manus AI
+Date: October 14, 2026
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter
+
+    Allows `rate` requests every `per` seconds. Tokens refill continuously,
+    so callers are spaced out evenly instead of sleeping fixed amounts.
+    """
+
+    def __init__(self, rate=25, per=60, capacity=None):
+        self.rate = rate
+        self.per = per
+        self.capacity = capacity if capacity is not None else rate
+        self.tokens = float(self.capacity)
+        self.fill_rate = rate / per  # Tokens per second
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        """Add tokens earned since the last refill (caller holds the lock)"""
+        now = time.monotonic()
+        elapsed = now - self.last_refill
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.fill_rate)
+        self.last_refill = now
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.fill_rate
+            time.sleep(delay)
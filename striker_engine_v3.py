@@ -8,14 +8,297 @@ Author: Manus AI
 Date: January 30, 2026
 """
 
-import requests
-import json
-from datetime import datetime, timedelta
+import requests_cache
+import logging
+import os
+import pickle
+import threading
+from math import isnan
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
 import time
-from ta.momentum import RSIIndicator
-from ta.trend import MACD, EMAIndicator
-from ta.volatility import BollingerBands
-import pandas as pd
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from indicators import _rsi_loop, _snapshot_loop, warmup
+from fast_json import response_json
+from file_io import atomic_write
+from rate_limit import TokenBucket
+
+log = logging.getLogger(__name__)
+
+# Indicator state is persisted next to the scripts so consecutive scans share it
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+RSI_WINDOW = 14
+MACD_FAST, MACD_SLOW, MACD_SIGNAL = 12, 26, 9
+BB_WINDOW, BB_STD = 20, 2.0
+
+# Compile the indicator kernels at import, before any coin is scored
+warmup()
+
+# Bars fed to the indicator kernel: MACD signal needs 26 + 9 - 1 = 34, plus slack.
+# EMAs/Wilder averages are seeded at the first bar of this tail, exactly as they
+# are seeded at the first bar of the 30-day fetch today.
+INDICATOR_LOOKBACK = 40
+
+# Max coins kept in the on-disk price history cache (least recently used go first)
+HISTORY_CACHE_MAX_ENTRIES = 500
+
+
+# Technical score buckets, looked up with np.searchsorted (works on scalars or arrays)
+# RSI: <20 | 20-30 | 30-40 | 40-60 | 60-70 | 70-80 | >=80
+_RSI_BINS = np.array([20, 30, 40, 60, 70, 80], dtype=np.float64)
+_RSI_SCORES = np.array([5, 18, 20, 15, 10, 3, 0])
+_RSI_DETAILS = (
+    "RSI: {:.1f} (extremely oversold: +5)",
+    "RSI: {:.1f} (oversold, good entry: +18)",
+    "RSI: {:.1f} (optimal buy zone: +20)",
+    "RSI: {:.1f} (neutral: +15)",
+    "RSI: {:.1f} (getting overbought: +10)",
+    "RSI: {:.1f} (overbought - SKIP: +3)",
+    "RSI: {:.1f} (extremely overbought - AVOID: +0)",
+)
+
+# MACD histogram: <-5 | -5..-2 | -2..0 | 0..2 | 2..5 | >5
+# Negative bounds are closed above (-5 -> bearish), positive ones below (5 -> bullish)
+_MACD_NEG_BINS = np.array([-5, -2], dtype=np.float64)
+_MACD_POS_BINS = np.array([0, 2, 5], dtype=np.float64)
+_MACD_SCORES = np.array([5, 8, 11, 14, 17, 20])
+_MACD_DETAILS = (
+    "MACD: {:.2f} (strong bearish: +5)",
+    "MACD: {:.2f} (bearish: +8)",
+    "MACD: {:.2f} (weak bearish: +11)",
+    "MACD: +{:.2f} (weak bullish: +14)",
+    "MACD: +{:.2f} (bullish: +17)",
+    "MACD: +{:.2f} (strong bullish: +20)",
+)
+
+# BB position: <0.2 | 0.2-0.4 | 0.4-0.6 | 0.6-0.8 | 0.8-1.0 (inclusive) | outside
+_BB_LOW_BINS = np.array([0.2, 0.4, 0.6, 0.8], dtype=np.float64)
+_BB_HIGH_BINS = np.array([1.0], dtype=np.float64)
+_BB_SCORES = np.array([18, 20, 15, 10, 5, 3])
+_BB_DETAILS = (
+    "BB: {:.2f} (near lower band, good entry: +18)",
+    "BB: {:.2f} (optimal buy zone: +20)",
+    "BB: {:.2f} (middle zone: +15)",
+    "BB: {:.2f} (upper zone: +10)",
+    "BB: {:.2f} (near upper band, overbought: +5)",
+    "BB: {:.2f} (outside bands: +3)",
+)
+
+# Fundamental score buckets, picked with np.select (first matching condition wins)
+# 24h change: >20 | 10-20 | 5-10 | 0-5 | -5..0 | < -5
+_MOMENTUM_SCORES = np.array([3, 10, 15, 12, 8, 5])
+_MOMENTUM_DETAILS = (
+    "24h: +{:.1f}% (too hot: +3)",
+    "24h: +{:.1f}% (strong: +10)",
+    "24h: +{:.1f}% (optimal: +15)",
+    "24h: +{:.1f}% (weak positive: +12)",
+    "24h: {:.1f}% (slight decline: +8)",
+    "24h: {:.1f}% (declining: +5)",
+)
+
+# Volume / market cap: >0.5 | 0.2-0.5 | 0.1-0.2 | <=0.1
+_VOLUME_SCORES = np.array([10, 8, 6, 3])
+_VOLUME_DETAILS = (
+    "Vol/MCap: {:.2f} (very high: +10)",
+    "Vol/MCap: {:.2f} (high: +8)",
+    "Vol/MCap: {:.2f} (good: +6)",
+    "Vol/MCap: {:.2f} (low: +3)",
+)
+
+# Market cap rank: <=50 | 51-100 | 101-250 | >250
+_RANK_SCORES = np.array([7, 10, 8, 5])
+_RANK_DETAILS = (
+    "Rank: #{} (large cap: +7)",
+    "Rank: #{} (mid cap: +10)",
+    "Rank: #{} (small cap: +8)",
+    "Rank: #{} (micro cap: +5)",
+)
+
+# |7d change| as a volatility proxy: >50 | 25-50 | <=25
+_VOLATILITY_SCORES = np.array([1, 3, 5])
+_VOLATILITY_DETAILS = (
+    "7d: {:+.1f}% (very volatile: +1)",
+    "7d: {:+.1f}% (volatile: +3)",
+    "7d: {:+.1f}% (stable: +5)",
+)
+
+
+def _rsi_bucket(rsi):
+    """Index into the _RSI_* tables"""
+    return np.searchsorted(_RSI_BINS, rsi, side='right')
+
+
+def _macd_bucket(macd_diff):
+    """Index into the _MACD_* tables"""
+    return (np.searchsorted(_MACD_NEG_BINS, macd_diff, side='right')
+            + np.searchsorted(_MACD_POS_BINS, macd_diff, side='left'))
+
+
+def _bb_bucket(bb_position):
+    """Index into the _BB_* tables"""
+    return (np.searchsorted(_BB_LOW_BINS, bb_position, side='right')
+            + np.searchsorted(_BB_HIGH_BINS, bb_position, side='left'))
+
+
+def _fundamental_buckets(change_24h, volume_to_mcap, rank, change_7d):
+    """Indices into the _MOMENTUM/_VOLUME/_RANK/_VOLATILITY tables (scalars or arrays)"""
+    momentum = np.select(
+        [change_24h > 20, change_24h > 10, change_24h > 5, change_24h > 0, change_24h >= -5],
+        [0, 1, 2, 3, 4], default=5
+    )
+    volume = np.select([volume_to_mcap > 0.5, volume_to_mcap > 0.2, volume_to_mcap > 0.1], [0, 1, 2], default=3)
+    rank = np.select([rank <= 50, rank <= 100, rank <= 250], [0, 1, 2], default=3)
+    volatility = np.select([np.abs(change_7d) > 50, np.abs(change_7d) > 25], [0, 1], default=2)
+    return momentum, volume, rank, volatility
+
+
+def _change_7d(coin):
+    """7d % change (None if absent); /coins/markets names it ..._7d_in_currency"""
+    change = coin.get('price_change_percentage_7d_in_currency')
+    return change if change is not None else coin.get('price_change_percentage_7d')
+
+
+def _fundamental_details(coin):
+    """Report text for one coin's fundamental score"""
+    change_24h = coin.get('price_change_percentage_24h') or 0
+    change_7d = _change_7d(coin) or 0
+    volume = coin.get('total_volume') or 0
+    market_cap = coin.get('market_cap') or 1
+    volume_to_mcap = volume / market_cap if market_cap > 0 else 0
+    rank = coin.get('market_cap_rank') or 999
+    momentum, volume_idx, rank_idx, volatility = _fundamental_buckets(change_24h, volume_to_mcap, rank, change_7d)
+    return " | ".join((
+        _MOMENTUM_DETAILS[int(momentum)].format(change_24h),
+        _VOLUME_DETAILS[int(volume_idx)].format(volume_to_mcap),
+        _RANK_DETAILS[int(rank_idx)].format(rank),
+        _VOLATILITY_DETAILS[int(volatility)].format(change_7d),
+    ))
+
+
+def _technical_details(rsi, macd_diff, bb_position):
+    """Report text for one coin's technical score (NaN metrics are neutral)"""
+    return " | ".join((
+        "RSI: N/A (neutral: +10)" if isnan(rsi) else _RSI_DETAILS[_rsi_bucket(rsi)].format(rsi),
+        "MACD: N/A (neutral: +10)" if isnan(macd_diff) else _MACD_DETAILS[_macd_bucket(macd_diff)].format(macd_diff),
+        "BB: N/A (neutral: +10)" if isnan(bb_position) else _BB_DETAILS[_bb_bucket(bb_position)].format(bb_position),
+    ))
+
+
+class StreamingIndicators:
+    """
+    RSI, MACD and Bollinger state for one coin as of its last closed bar
+
+    Each new bar is folded in with O(1) work (Wilder averages, EMAs and
+    rolling sums over the last BB_WINDOW closes), so a warm coin never
+    replays its history. Seeding and warmup NaNs match _snapshot_loop.
+    """
+
+    __slots__ = ('bars', 'last_close', 'last_ts', 'rsi_avg_gain', 'rsi_avg_loss',
+                 'ema12', 'ema26', 'macd_signal', 'bb_window', 'bb_sum', 'bb_sumsq')
+
+    ALPHA_FAST = 2.0 / (MACD_FAST + 1)
+    ALPHA_SLOW = 2.0 / (MACD_SLOW + 1)
+    ALPHA_SIGNAL = 2.0 / (MACD_SIGNAL + 1)
+
+    def __init__(self, first_close, first_ts):
+        first_close = float(first_close)
+        self.bars = 1
+        self.last_close = first_close
+        self.last_ts = int(first_ts)  # Bar timestamp, ms since epoch
+        self.rsi_avg_gain = 0.0
+        self.rsi_avg_loss = 0.0
+        self.ema12 = first_close
+        self.ema26 = first_close
+        self.macd_signal = float('nan')
+        self.bb_window = deque([first_close], maxlen=BB_WINDOW)
+        self.bb_sum = first_close
+        self.bb_sumsq = first_close * first_close
+
+    def _step(self, price):
+        """State after folding in price, as a tuple (nothing is stored)"""
+        change = price - self.last_close
+        gain = change if change > 0 else 0.0
+        loss = -change if change < 0 else 0.0
+        avg_gain = (self.rsi_avg_gain * (RSI_WINDOW - 1) + gain) / RSI_WINDOW
+        avg_loss = (self.rsi_avg_loss * (RSI_WINDOW - 1) + loss) / RSI_WINDOW
+
+        ema12 = self.ema12 + self.ALPHA_FAST * (price - self.ema12)
+        ema26 = self.ema26 + self.ALPHA_SLOW * (price - self.ema26)
+        bars = self.bars + 1
+        if bars == MACD_SLOW:
+            macd_signal = ema12 - ema26  # Signal EMA seeded with the first MACD value
+        elif bars > MACD_SLOW:
+            macd_signal = self.macd_signal + self.ALPHA_SIGNAL * ((ema12 - ema26) - self.macd_signal)
+        else:
+            macd_signal = float('nan')
+
+        bb_sum = self.bb_sum + price
+        bb_sumsq = self.bb_sumsq + price * price
+        if len(self.bb_window) == BB_WINDOW:
+            oldest = self.bb_window[0]
+            bb_sum -= oldest
+            bb_sumsq -= oldest * oldest
+        return bars, avg_gain, avg_loss, ema12, ema26, macd_signal, bb_sum, bb_sumsq
+
+    def update(self, price, ts):
+        """Fold in one closed bar"""
+        price = float(price)
+        (self.bars, self.rsi_avg_gain, self.rsi_avg_loss, self.ema12, self.ema26,
+         self.macd_signal, self.bb_sum, self.bb_sumsq) = self._step(price)
+        self.bb_window.append(price)
+        self.last_close = price
+        self.last_ts = int(ts)
+        if self.bars % BB_WINDOW == 0:
+            # Re-sum once per full window so add/subtract rounding can't accumulate
+            self.bb_sum = sum(self.bb_window)
+            self.bb_sumsq = sum(p * p for p in self.bb_window)
+
+    def snapshot(self, live_price):
+        """
+        Indicator values with live_price applied as a provisional bar
+        Returns (rsi, macd, macd_signal, macd_diff, bb_upper, bb_lower,
+        bb_middle) like _snapshot_loop; NaN where there is not enough data.
+        """
+        (bars, avg_gain, avg_loss, ema12, ema26,
+         macd_signal, bb_sum, bb_sumsq) = self._step(float(live_price))
+
+        nan = float('nan')
+        rsi = rsi_from_averages(avg_gain, avg_loss) if bars >= RSI_WINDOW else nan
+        macd = ema12 - ema26 if bars >= MACD_SLOW else nan
+        if bars < MACD_SLOW + MACD_SIGNAL - 1:
+            macd_signal = nan
+
+        bb_upper = bb_lower = bb_middle = nan
+        if bars >= BB_WINDOW:
+            bb_middle = bb_sum / BB_WINDOW
+            std = max(bb_sumsq / BB_WINDOW - bb_middle * bb_middle, 0.0) ** 0.5
+            bb_upper = bb_middle + BB_STD * std
+            bb_lower = bb_middle - BB_STD * std
+
+        return rsi, macd, macd_signal, macd - macd_signal, bb_upper, bb_lower, bb_middle
+
+
+@dataclass(slots=True)
+class PriceHistory:
+    """Price series from /market_chart as parallel arrays (last point is the live price)"""
+    timestamps: np.ndarray  # int64 ms since epoch
+    prices: np.ndarray  # float64 AUD
+
+    def __len__(self):
+        return self.prices.shape[0]
+
+
+def rsi_from_averages(avg_gain, avg_loss):
+    """Convert Wilder averages to an RSI value (100 when there are no losses)"""
+    if avg_loss == 0:
+        return 100.0
+    return 100 - 100 / (1 + avg_gain / avg_loss)
 
 
 class StrikerEngineV3:
@@ -29,74 +312,248 @@ class StrikerEngineV3:
     - Narrative Analysis: 20 points
     """
 
-    def __init__(self):
+    # Max in-flight /market_chart requests (throughput is capped by rate_limiter)
+    MAX_CONCURRENT_REQUESTS = 5
+
+    def __init__(self, rate_limiter=None, session=None):
         self.base_url = "https://api.coingecko.com/api/v3"
+        # Share the caller's limiter so all CoinGecko requests draw from one budget
+        self.rate_limiter = rate_limiter or TokenBucket(rate=25, per=60)
+        # One pooled keep-alive session (shared with the caller when given);
+        # the cache revalidates with ETag/Last-Modified once entries expire
+        self.session = session or requests_cache.CachedSession(
+            os.path.join(CACHE_DIR, 'cg'),
+            backend='sqlite',
+            expire_after=60,
+            cache_control=True,
+            stale_if_error=True
+        )
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.state_path = os.path.join(CACHE_DIR, 'indicator_state.pkl')
+        self.history_dir = os.path.join(CACHE_DIR, 'history')
+        self.indicator_state = self._load_indicator_state()
+        self._state_lock = threading.Lock()
+
+    def _load_indicator_state(self):
+        """Load persisted per-coin indicator state (empty on first run)"""
+        try:
+            with open(self.state_path, 'rb') as f:
+                state = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError):
+            return {}  # AttributeError: saved by an older version (RSI-only state)
+        return {
+            coin_id: entry for coin_id, entry in state.items()
+            if isinstance(entry, StreamingIndicators)
+        }
+
+    def save_indicator_state(self):
+        """Persist per-coin indicator state so the next scan can update incrementally"""
+        os.makedirs(os.path.dirname(self.state_path), exist_ok=True)
+        with self._state_lock:
+            atomic_write(self.state_path, pickle.dumps(self.indicator_state))
+
+    def streaming_indicators(self, coin_id, history):
+        """
+        Last-bar indicators for coin_id from its persisted streaming state
+
+        The last point from /market_chart is the live price, so state only
+        advances over closed bars (O(1) each) and the live price is applied
+        on top. Rebuilt from the window when there is no usable state.
+        """
+        closed_ts = history.timestamps[:-1]
+        closes = history.prices[:-1]
+        with self._state_lock:
+            state = self.indicator_state.get(coin_id)
+
+        if state is not None and (closed_ts == state.last_ts).any():
+            # Warm start: only fold in bars newer than the stored state
+            start = int(np.searchsorted(closed_ts, state.last_ts, side='right'))
+        else:
+            # Cold start: seeded at the first bar, as in the ta library
+            state = StreamingIndicators(closes[0], closed_ts[0])
+            start = 1
+        for ts, price in zip(closed_ts[start:].tolist(), closes[start:].tolist()):
+            state.update(price, ts)
+
+        with self._state_lock:
+            self.indicator_state[coin_id] = state
+        return state.snapshot(history.prices[-1])
+
+    def _history_path(self, coin_id, days, vs_currency='aud'):
+        """Cache file for one coin's closed daily bars"""
+        return os.path.join(self.history_dir, f"{coin_id}_{vs_currency}_{days}_daily.pkl")
+
+    def _load_cached_history(self, coin_id, days):
+        """Closed bars cached today (UTC) for coin_id, or None"""
+        path = self._history_path(coin_id, days)
+        try:
+            with open(path, 'rb') as f:
+                day, closed = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, ValueError):
+            return None
+        if day != datetime.utcnow().date() or not isinstance(closed, PriceHistory):
+            return None  # A new daily bar has closed since (or old format) - refetch
+        os.utime(path)  # Mark as recently used
+        return closed
+
+    def _store_cached_history(self, coin_id, days, history):
+        """Cache the closed bars of history (everything but the live last point)"""
+        os.makedirs(self.history_dir, exist_ok=True)
+        closed = PriceHistory(history.timestamps[:-1], history.prices[:-1])
+        atomic_write(self._history_path(coin_id, days), pickle.dumps((datetime.utcnow().date(), closed)))
+        self._prune_history_cache()
+
+    def _prune_history_cache(self):
+        """Drop least recently used cache files beyond HISTORY_CACHE_MAX_ENTRIES"""
+        try:
+            entries = [entry for entry in os.scandir(self.history_dir) if entry.name.endswith('.pkl')]
+        except OSError:
+            return
+        if len(entries) <= HISTORY_CACHE_MAX_ENTRIES:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - HISTORY_CACHE_MAX_ENTRIES]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def fetch_historical_prices(self, coin_id, days=30, live_price=None):
+        """
+        Fetch historical price data for technical analysis
+        Daily bars don't change once closed, so they are cached on disk per
+        UTC day. With live_price (current AUD price from /coins/markets) a
+        cache hit needs no HTTP request: the live price becomes the last point.
+        """
+        if live_price is not None:
+            closed = self._load_cached_history(coin_id, days)
+            if closed is not None:
+                return PriceHistory(
+                    np.append(closed.timestamps, np.int64(time.time() * 1000)),
+                    np.append(closed.prices, float(live_price))
+                )
 
-    def fetch_historical_prices(self, coin_id, days=30):
-        """Fetch historical price data for technical analysis"""
         try:
             url = f"{self.base_url}/coins/{coin_id}/market_chart"
             params = {
                 'vs_currency': 'aud',
-                'days': days
-                # No interval specified = daily data (free tier compatible)
+                'days': days,
+                # Without it 2-90 day ranges come back hourly; daily is free tier compatible
+                'interval': 'daily'
             }
-            response = requests.get(url, params=params, timeout=10)
+            self.rate_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = response_json(response)
 
-            # Convert to pandas DataFrame
+            # [[ms, price], ...] -> parallel numpy arrays
             prices = data['prices']
-            df = pd.DataFrame(prices, columns=['timestamp', 'price'])
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
+            history = PriceHistory(
+                np.fromiter((p[0] for p in prices), dtype=np.int64, count=len(prices)),
+                np.fromiter((p[1] for p in prices), dtype=np.float64, count=len(prices))
+            )
+
+            try:
+                self._store_cached_history(coin_id, days, history)
+            except OSError as e:
+                log.warning("  Could not cache historical data for %s: %s", coin_id, e)
 
-            return df
+            return history
         except Exception as e:
-            print(f"  Error fetching historical data for {coin_id}: {e}")
+            log.warning("  Error fetching historical data for %s: %s", coin_id, e)
             return None
 
-    def calculate_technical_indicators(self, df):
-        """Calculate RSI, MACD, and Bollinger Bands"""
-        if df is None or len(df) < 26:  # Need at least 26 periods for MACD
+    def fetch_histories(self, coin_ids, max_workers=None, live_prices=None):
+        """
+        Fetch price history for many coins concurrently
+        Round trips overlap instead of running back to back; rate_limiter
+        still spaces the requests. live_prices ({coin_id: price}) lets
+        cached histories skip the request. Returns {coin_id: PriceHistory}, failures omitted.
+        """
+        if not coin_ids:
+            return {}
+        live_prices = live_prices or {}
+        workers = max_workers or self.MAX_CONCURRENT_REQUESTS
+        with ThreadPoolExecutor(max_workers=min(workers, len(coin_ids))) as executor:
+            histories = list(executor.map(
+                lambda coin_id: self.fetch_historical_prices(coin_id, live_price=live_prices.get(coin_id)),
+                coin_ids
+            ))
+        return {
+            coin_id: history
+            for coin_id, history in zip(coin_ids, histories) if history is not None
+        }
+
+    def latest_rsi(self, history, coin_id=None):
+        """
+        RSI(14) for the last bar only (NaN without enough history)
+        Cheap pre-check so overbought coins can be dropped before full scoring
+        """
+        if history is None or len(history) < 26:  # Same minimum as calculate_technical_indicators
+            return float('nan')
+        if coin_id is not None:
+            return self.streaming_indicators(coin_id, history)[0]
+        return _rsi_loop(history.prices, RSI_WINDOW)[-1]
+
+    def _indicator_values(self, history, coin_id=None):
+        """
+        Last-bar (rsi, macd, macd_signal, macd_diff, bb_upper, bb_lower,
+        bb_middle, current_price), or None without enough history
+        With coin_id, values come from the persisted streaming state
+        """
+        if history is None or len(history) < 26:  # Need at least 26 periods for MACD
             return None
 
         try:
-            # RSI (14-period)
-            rsi_indicator = RSIIndicator(close=df['price'], window=14)
-            rsi = rsi_indicator.rsi().iloc[-1]
-
-            # MACD
-            macd_indicator = MACD(close=df['price'])
-            macd = macd_indicator.macd().iloc[-1]
-            macd_signal = macd_indicator.macd_signal().iloc[-1]
-            macd_diff = macd_indicator.macd_diff().iloc[-1]
-
-            # Bollinger Bands
-            bb_indicator = BollingerBands(close=df['price'])
-            bb_upper = bb_indicator.bollinger_hband().iloc[-1]
-            bb_lower = bb_indicator.bollinger_lband().iloc[-1]
-            bb_middle = bb_indicator.bollinger_mavg().iloc[-1]
-            current_price = df['price'].iloc[-1]
-
-            # Calculate BB position (0 = lower band, 0.5 = middle, 1 = upper band)
-            bb_position = (current_price - bb_lower) / (bb_upper - bb_lower) if (bb_upper - bb_lower) > 0 else 0.5
-
-            return {
-                'rsi': rsi,
-                'macd': macd,
-                'macd_signal': macd_signal,
-                'macd_diff': macd_diff,
-                'bb_upper': bb_upper,
-                'bb_lower': bb_lower,
-                'bb_middle': bb_middle,
-                'bb_position': bb_position,
-                'current_price': current_price
-            }
+            # RSI (14), MACD (12/26/9) and Bollinger Bands (20, 2 std)
+            if coin_id is not None:
+                values = self.streaming_indicators(coin_id, history)
+            else:
+                # One pass over the tail (only it matters for last-bar values)
+                values = _snapshot_loop(
+                    history.prices[-INDICATOR_LOOKBACK:], RSI_WINDOW,
+                    MACD_FAST, MACD_SLOW, MACD_SIGNAL, BB_WINDOW, BB_STD
+                )
+            return (*values, history.prices[-1])
         except Exception as e:
-            print(f"  Error calculating technical indicators: {e}")
+            log.warning("  Error calculating technical indicators: %s", e)
             return None
 
+    @staticmethod
+    def _indicator_dict(values, bb_position):
+        """calculate_technical_indicators' dict for one coin's _indicator_values"""
+        (rsi, macd, macd_signal, macd_diff,
+         bb_upper, bb_lower, bb_middle, current_price) = values
+        return {
+            'rsi': rsi,
+            'macd': macd,
+            'macd_signal': macd_signal,
+            'macd_diff': macd_diff,
+            'bb_upper': bb_upper,
+            'bb_lower': bb_lower,
+            'bb_middle': bb_middle,
+            'bb_position': bb_position,
+            'current_price': current_price
+        }
+
+    def calculate_technical_indicators(self, history, coin_id=None):
+        """
+        Calculate RSI, MACD, and Bollinger Bands
+        With coin_id, values come from the persisted streaming state
+        """
+        values = self._indicator_values(history, coin_id)
+        if values is None:
+            return None
+        # BB position (0 = lower band, 0.5 = middle, 1 = upper band)
+        bb_position = float(self.bb_position_batch(values[7], values[4], values[5]))
+        return self._indicator_dict(values, bb_position)
+
     def score_technical(self, coin_data, technical_indicators):
         """
         Score technical analysis (60 points max)
@@ -109,95 +566,40 @@ class StrikerEngineV3:
         if technical_indicators is None:
             return 30, "No technical data available"  # Neutral score
 
-        score = 0
-        details = []
-
-        # RSI Scoring (20 points)
         rsi = technical_indicators['rsi']
-        if pd.isna(rsi):
-            rsi_score = 10
-            details.append(f"RSI: N/A (neutral: +10)")
-        elif rsi < 20:
-            rsi_score = 5  # Extremely oversold - risky
-            details.append(f"RSI: {rsi:.1f} (extremely oversold: +5)")
-        elif 20 <= rsi < 30:
-            rsi_score = 18  # Oversold - good entry
-            details.append(f"RSI: {rsi:.1f} (oversold, good entry: +18)")
-        elif 30 <= rsi < 40:
-            rsi_score = 20  # Optimal buy zone
-            details.append(f"RSI: {rsi:.1f} (optimal buy zone: +20)")
-        elif 40 <= rsi < 60:
-            rsi_score = 15  # Neutral
-            details.append(f"RSI: {rsi:.1f} (neutral: +15)")
-        elif 60 <= rsi < 70:
-            rsi_score = 10  # Getting overbought
-            details.append(f"RSI: {rsi:.1f} (getting overbought: +10)")
-        elif 70 <= rsi < 80:
-            rsi_score = 3  # Overbought - SKIP
-            details.append(f"RSI: {rsi:.1f} (overbought - SKIP: +3)")
-        else:  # >= 80
-            rsi_score = 0  # Extremely overbought - AVOID
-            details.append(f"RSI: {rsi:.1f} (extremely overbought - AVOID: +0)")
-
-        score += rsi_score
-
-        # MACD Scoring (20 points)
         macd_diff = technical_indicators['macd_diff']
-        if pd.isna(macd_diff):
-            macd_score = 10
-            details.append(f"MACD: N/A (neutral: +10)")
-        elif macd_diff > 0:
-            # Bullish - MACD above signal
-            if macd_diff > 5:
-                macd_score = 20  # Strong bullish momentum
-                details.append(f"MACD: +{macd_diff:.2f} (strong bullish: +20)")
-            elif macd_diff > 2:
-                macd_score = 17  # Good bullish momentum
-                details.append(f"MACD: +{macd_diff:.2f} (bullish: +17)")
-            else:
-                macd_score = 14  # Weak bullish
-                details.append(f"MACD: +{macd_diff:.2f} (weak bullish: +14)")
-        else:
-            # Bearish - MACD below signal
-            if macd_diff < -5:
-                macd_score = 5  # Strong bearish - avoid
-                details.append(f"MACD: {macd_diff:.2f} (strong bearish: +5)")
-            elif macd_diff < -2:
-                macd_score = 8  # Bearish
-                details.append(f"MACD: {macd_diff:.2f} (bearish: +8)")
-            else:
-                macd_score = 11  # Weak bearish - potential reversal
-                details.append(f"MACD: {macd_diff:.2f} (weak bearish: +11)")
-
-        score += macd_score
-
-        # Bollinger Bands Scoring (20 points)
         bb_position = technical_indicators['bb_position']
-        if pd.isna(bb_position):
-            bb_score = 10
-            details.append(f"BB: N/A (neutral: +10)")
-        elif bb_position < 0.2:
-            bb_score = 18  # Near lower band - good entry
-            details.append(f"BB: {bb_position:.2f} (near lower band, good entry: +18)")
-        elif 0.2 <= bb_position < 0.4:
-            bb_score = 20  # Optimal buy zone
-            details.append(f"BB: {bb_position:.2f} (optimal buy zone: +20)")
-        elif 0.4 <= bb_position < 0.6:
-            bb_score = 15  # Middle zone - neutral
-            details.append(f"BB: {bb_position:.2f} (middle zone: +15)")
-        elif 0.6 <= bb_position < 0.8:
-            bb_score = 10  # Upper zone - caution
-            details.append(f"BB: {bb_position:.2f} (upper zone: +10)")
-        elif 0.8 <= bb_position <= 1.0:
-            bb_score = 5  # Near upper band - overbought
-            details.append(f"BB: {bb_position:.2f} (near upper band, overbought: +5)")
-        else:
-            bb_score = 3  # Outside bands - extreme
-            details.append(f"BB: {bb_position:.2f} (outside bands: +3)")
-
-        score += bb_score
+        score = int(self.score_technical_batch(rsi, macd_diff, bb_position))
+        return score, _technical_details(rsi, macd_diff, bb_position)
 
-        return score, " | ".join(details)
+    @staticmethod
+    def bb_position_batch(prices, bb_upper, bb_lower):
+        """
+        BB position (0 = lower band, 0.5 = middle, 1 = upper band) for many coins
+        Branch-free safe divide: 0.5 where the bands have no width (including
+        NaN bands from short histories). Also used for single coins.
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        width = np.asarray(bb_upper, dtype=np.float64) - np.asarray(bb_lower, dtype=np.float64)
+        valid = width > 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            position = (prices - bb_lower) / np.where(valid, width, 1.0)
+        return np.where(valid, position, 0.5)
+
+    @staticmethod
+    def score_technical_batch(rsis, macd_diffs, bb_positions):
+        """
+        Technical scores (60 points max) for many coins at once
+        Same buckets as score_technical; NaN inputs score a neutral 10
+        """
+        rsis = np.asarray(rsis, dtype=np.float64)
+        macd_diffs = np.asarray(macd_diffs, dtype=np.float64)
+        bb_positions = np.asarray(bb_positions, dtype=np.float64)
+        return (
+            np.where(np.isnan(rsis), 10, _RSI_SCORES[_rsi_bucket(rsis)])
+            + np.where(np.isnan(macd_diffs), 10, _MACD_SCORES[_macd_bucket(macd_diffs)])
+            + np.where(np.isnan(bb_positions), 10, _BB_SCORES[_bb_bucket(bb_positions)])
+        )
 
     def score_fundamental(self, coin_data):
         """
@@ -209,87 +611,34 @@ class StrikerEngineV3:
         - Market cap rank: 10 points
         - Volatility: 5 points
         """
-        score = 0
-        details = []
-
-        # Price momentum (15 points)
-        change_24h = coin_data.get('price_change_percentage_24h', 0) or 0
-        change_7d = coin_data.get('price_change_percentage_7d', 0) or 0
-
-        if change_24h > 20:
-            momentum_score = 3  # Too hot, likely overbought
-            details.append(f"24h: +{change_24h:.1f}% (too hot: +3)")
-        elif 10 < change_24h <= 20:
-            momentum_score = 10  # Strong but not extreme
-            details.append(f"24h: +{change_24h:.1f}% (strong: +10)")
-        elif 5 < change_24h <= 10:
-            momentum_score = 15  # Optimal momentum
-            details.append(f"24h: +{change_24h:.1f}% (optimal: +15)")
-        elif 0 < change_24h <= 5:
-            momentum_score = 12  # Positive but weak
-            details.append(f"24h: +{change_24h:.1f}% (weak positive: +12)")
-        elif -5 <= change_24h <= 0:
-            momentum_score = 8  # Slight decline
-            details.append(f"24h: {change_24h:.1f}% (slight decline: +8)")
-        else:
-            momentum_score = 5  # Declining
-            details.append(f"24h: {change_24h:.1f}% (declining: +5)")
-
-        score += momentum_score
-
-        # Volume (10 points)
-        volume = coin_data.get('total_volume', 0) or 0
-        market_cap = coin_data.get('market_cap', 1) or 1
-        volume_to_mcap = volume / market_cap if market_cap > 0 else 0
-
-        if volume_to_mcap > 0.5:
-            volume_score = 10  # Very high volume
-            details.append(f"Vol/MCap: {volume_to_mcap:.2f} (very high: +10)")
-        elif volume_to_mcap > 0.2:
-            volume_score = 8  # High volume
-            details.append(f"Vol/MCap: {volume_to_mcap:.2f} (high: +8)")
-        elif volume_to_mcap > 0.1:
-            volume_score = 6  # Good volume
-            details.append(f"Vol/MCap: {volume_to_mcap:.2f} (good: +6)")
-        else:
-            volume_score = 3  # Low volume
-            details.append(f"Vol/MCap: {volume_to_mcap:.2f} (low: +3)")
-
-        score += volume_score
-
-        # Market cap rank (10 points)
-        rank = coin_data.get('market_cap_rank', 999) or 999
-
-        if rank <= 50:
-            rank_score = 7  # Large cap - safer but less upside
-            details.append(f"Rank: #{rank} (large cap: +7)")
-        elif rank <= 100:
-            rank_score = 10  # Mid cap - good balance
-            details.append(f"Rank: #{rank} (mid cap: +10)")
-        elif rank <= 250:
-            rank_score = 8  # Small cap - higher risk/reward
-            details.append(f"Rank: #{rank} (small cap: +8)")
-        else:
-            rank_score = 5  # Micro cap - very high risk
-            details.append(f"Rank: #{rank} (micro cap: +5)")
-
-        score += rank_score
-
-        # Volatility (5 points)
-        # Using 7d change as proxy for volatility
-        if abs(change_7d) > 50:
-            volatility_score = 1  # Very volatile
-            details.append(f"7d: {change_7d:+.1f}% (very volatile: +1)")
-        elif abs(change_7d) > 25:
-            volatility_score = 3  # Volatile
-            details.append(f"7d: {change_7d:+.1f}% (volatile: +3)")
-        else:
-            volatility_score = 5  # Stable
-            details.append(f"7d: {change_7d:+.1f}% (stable: +5)")
+        return int(self.score_fundamental_batch([coin_data])[0]), _fundamental_details(coin_data)
 
-        score += volatility_score
+    @staticmethod
+    def score_fundamental_batch(coins):
+        """
+        Fundamental scores (40 points max) for many /coins/markets entries at once
+        Same buckets and missing-value fallbacks as score_fundamental, evaluated
+        a column at a time. Returns an int array in input order.
+        """
+        count = len(coins)
+
+        def column(get):
+            return np.fromiter((get(coin) or 0 for coin in coins), dtype=np.float64, count=count)
+
+        change_24h = column(lambda coin: coin.get('price_change_percentage_24h'))
+        change_7d = column(_change_7d)
+        volume = column(lambda coin: coin.get('total_volume'))
+        market_cap = column(lambda coin: coin.get('market_cap'))
+        rank = column(lambda coin: coin.get('market_cap_rank'))
+
+        # Same falsy fallbacks as score_fundamental (missing/0 mcap -> 1, rank -> 999)
+        market_cap = np.where(market_cap == 0, 1, market_cap)
+        rank = np.where(rank == 0, 999, rank)
+        volume_to_mcap = np.where(market_cap > 0, volume / market_cap, 0)
 
-        return score, " | ".join(details)
+        momentum, volume_idx, rank_idx, volatility = _fundamental_buckets(change_24h, volume_to_mcap, rank, change_7d)
+        return (_MOMENTUM_SCORES[momentum] + _VOLUME_SCORES[volume_idx]
+                + _RANK_SCORES[rank_idx] + _VOLATILITY_SCORES[volatility])
 
     def score_catalyst(self, coin_data):
         """
@@ -311,53 +660,111 @@ class StrikerEngineV3:
         # For now, give a neutral score
         return 10, "Narrative analysis requires sector data"
 
-    def score_coin(self, coin_data):
+    def score_coins(self, coins, max_workers=10):
+        """
+        Score many coins on a thread pool
+        Each worker fetches its coin's history (I/O overlaps across coins,
+        spaced by rate_limiter over the shared pooled session) and scores it.
+        Returns a list of (total_score, breakdown) in input order
+        """
+        if not coins:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(coins))) as executor:
+            return list(executor.map(self.score_coin, coins))
+
+    def score_coin(self, coin_data, history=None):
         """
         Score a single coin across all categories
+        Pass a prefetched price history to skip the per-coin HTTP request
+        """
+        # Technical Analysis
+        if history is None:
+            history = self.fetch_historical_prices(coin_data['id'], live_price=coin_data.get('current_price'))
+        technical_indicators = self.calculate_technical_indicators(history, coin_id=coin_data['id'])
+        technical = self.score_technical(coin_data, technical_indicators)
+
+        # Fundamental Analysis
+        fundamental = self.score_fundamental(coin_data)
+
+        return self._score_breakdown(coin_data, technical_indicators, technical, fundamental)
+
+    def score_coins_batch(self, coins, histories):
+        """
+        Score many coins whose price histories are already fetched
+        Indicators come from each coin's streaming state; BB positions and
+        the technical and fundamental scores are then computed for the whole
+        batch with numpy.
+        Coins missing from histories get the neutral technical score (no
+        request is made). Returns breakdowns in input order.
         """
-        total_score = 0
+        if not coins:
+            return []
+        count = len(coins)
+        values = [self._indicator_values(histories.get(coin['id']), coin_id=coin['id']) for coin in coins]
+
+        def column(index):
+            return np.fromiter(
+                (v[index] if v is not None else np.nan for v in values),
+                dtype=np.float64, count=count
+            )
+
+        # (rsi, macd, macd_signal, macd_diff, bb_upper, bb_lower, bb_middle, current_price)
+        rsis, macd_diffs = column(0), column(3)
+        bb_positions = self.bb_position_batch(column(7), column(4), column(5))
+        technical_scores = self.score_technical_batch(rsis, macd_diffs, bb_positions)
+        fundamental_scores = self.score_fundamental_batch(coins)
+        indicators = [
+            self._indicator_dict(v, float(bb_positions[i])) if v is not None else None
+            for i, v in enumerate(values)
+        ]
+
+        breakdowns = []
+        for i, coin in enumerate(coins):
+            if indicators[i] is None:
+                technical = (30, "No technical data available")  # Neutral score
+            else:
+                technical = (int(technical_scores[i]),
+                             _technical_details(rsis[i], macd_diffs[i], bb_positions[i]))
+            fundamental = (int(fundamental_scores[i]), _fundamental_details(coin))
+            breakdowns.append(self._score_breakdown(coin, indicators[i], technical, fundamental)[1])
+        return breakdowns
+
+    def _score_breakdown(self, coin_data, technical_indicators, technical, fundamental):
+        """Add the placeholder categories, log the result and return (total_score, breakdown)"""
+        technical_score, technical_details = technical
+        fundamental_score, fundamental_details = fundamental
+        catalyst_score, catalyst_details = self.score_catalyst(coin_data)  # Placeholder
+        narrative_score, narrative_details = self.score_narrative(coin_data)  # Placeholder
+        total_score = technical_score + fundamental_score + catalyst_score + narrative_score
+
         breakdown = {
             'coin_name': coin_data.get('name'),
             'symbol': coin_data.get('symbol', '').upper(),
             'price': coin_data.get('current_price'),
             'market_cap_rank': coin_data.get('market_cap_rank'),
             'change_24h': coin_data.get('price_change_percentage_24h'),
-            'change_7d': coin_data.get('price_change_percentage_7d'),
+            'change_7d': _change_7d(coin_data),
+            'technical_score': technical_score,
+            'technical_details': technical_details,
+            'technical_indicators': technical_indicators,
+            'fundamental_score': fundamental_score,
+            'fundamental_details': fundamental_details,
+            'catalyst_score': catalyst_score,
+            'catalyst_details': catalyst_details,
+            'narrative_score': narrative_score,
+            'narrative_details': narrative_details,
+            'total_score': total_score,
         }
 
-        # Technical Analysis
-        df = self.fetch_historical_prices(coin_data['id'])
-        technical_indicators = self.calculate_technical_indicators(df)
-        technical_score, technical_details = self.score_technical(coin_data, technical_indicators)
-        total_score += technical_score
-        breakdown['technical_score'] = technical_score
-        breakdown['technical_details'] = technical_details
-        breakdown['technical_indicators'] = technical_indicators
-
-        # Fundamental Analysis
-        fundamental_score, fundamental_details = self.score_fundamental(coin_data)
-        total_score += fundamental_score
-        breakdown['fundamental_score'] = fundamental_score
-        breakdown['fundamental_details'] = fundamental_details
-
-        # Catalyst Analysis (placeholder)
-        catalyst_score, catalyst_details = self.score_catalyst(coin_data)
-        total_score += catalyst_score
-        breakdown['catalyst_score'] = catalyst_score
-        breakdown['catalyst_details'] = catalyst_details
-
-        # Narrative Analysis (placeholder)
-        narrative_score, narrative_details = self.score_narrative(coin_data)
-        total_score += narrative_score
-        breakdown['narrative_score'] = narrative_score
-        breakdown['narrative_details'] = narrative_details
-
-        breakdown['total_score'] = total_score
-
-        print(f"  - Technical: {technical_score}/60")
-        print(f"  - Fundamental: {fundamental_score}/40")
-        print(f"  - Catalyst: {catalyst_score}/40")
-        print(f"  - Narrative: {narrative_score}/20")
-        print(f"  - TOTAL: {total_score}/160")
+        # One record per coin so concurrent scoring doesn't interleave lines;
+        # formatting is skipped entirely when INFO is disabled
+        log.info("  %s:\n"
+                 "  - Technical: %s/60\n"
+                 "  - Fundamental: %s/40\n"
+                 "  - Catalyst: %s/40\n"
+                 "  - Narrative: %s/20\n"
+                 "  - TOTAL: %s/160",
+                 breakdown['coin_name'], technical_score, fundamental_score,
+                 catalyst_score, narrative_score, total_score)
 
         return total_score, breakdown
@@ -9,8 +9,98 @@ Date: January 30, 2026
 
 import os
 import asyncio
+import atexit
+import functools
+import threading
 from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import BadRequest, TelegramError
+
+
+class BatchedAlertQueue:
+    """
+    Coalesces alerts sent within a short window into one Telegram message
+
+    Messages are collected on the Bot's event loop; `window` seconds after
+    the first one arrives they are joined with SEPARATOR and sent in as few
+    messages as Telegram's length limit allows. If a combined message is
+    rejected (e.g. Markdown broken across the join) its parts go out one by one.
+    """
+
+    MAX_MESSAGE_LENGTH = 4096
+    SEPARATOR = "\n\n---\n\n"
+
+    def __init__(self, send, loop, window=0.5):
+        self._send = send  # Coroutine function taking the message text
+        self._loop = loop
+        self.window = window
+        self._pending = []  # Only touched on self._loop
+        self._flush_task = None  # Window task still sleeping, if any
+        self._sending = set()  # Window tasks whose digest is being sent
+
+    def put(self, message):
+        """Queue a message (thread-safe, returns immediately)"""
+        self._loop.call_soon_threadsafe(self._add, message)
+
+    def _add(self, message):
+        self._pending.append(message)
+        if self._flush_task is None:
+            self._flush_task = self._loop.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self):
+        await asyncio.sleep(self.window)
+        task, self._flush_task = self._flush_task, None
+        self._sending.add(task)
+        try:
+            await self._flush_pending()
+        finally:
+            self._sending.discard(task)
+
+    async def _flush_pending(self):
+        messages, self._pending = self._pending, []
+        for parts in self._batches(messages):
+            try:
+                await self._send(self.SEPARATOR.join(parts))
+            except BadRequest as e:
+                if len(parts) == 1:
+                    print(f"\u274c Telegram rejected alert: {e}")
+                    continue
+                for part in parts:
+                    try:
+                        await self._send(part)
+                    except TelegramError as e:
+                        print(f"\u274c Telegram error: {e}")
+            except Exception as e:
+                print(f"\u274c Error sending alert digest: {e}")
+
+    def _batches(self, messages):
+        """Group messages so each joined batch fits in one Telegram message"""
+        limit = self.MAX_MESSAGE_LENGTH
+        batch, size = [], 0
+        for message in messages:
+            # An oversized single alert is split into limit-sized pieces
+            pieces = [message[i:i + limit] for i in range(0, len(message), limit)] or [message]
+            for piece in pieces:
+                extra = len(piece) + (len(self.SEPARATOR) if batch else 0)
+                if batch and size + extra > limit:
+                    yield batch
+                    batch, size = [], 0
+                    extra = len(piece)
+                batch.append(piece)
+                size += extra
+        if batch:
+            yield batch
+
+    def flush(self, timeout=None):
+        """Send everything queued so far and wait for it, including digests already in flight (thread-safe)"""
+        async def _flush_now():
+            if self._flush_task is not None:
+                self._flush_task.cancel()  # Still in its window, nothing sent yet
+                self._flush_task = None
+            if self._sending:
+                await asyncio.gather(*self._sending, return_exceptions=True)
+            await self._flush_pending()
+
+        asyncio.run_coroutine_threadsafe(_flush_now(), self._loop).result(timeout=timeout)
 
 
 class TelegramAlerts:
@@ -33,7 +123,10 @@ class TelegramAlerts:
        export TELEGRAM_CHAT_ID='your_chat_id'
     """
 
-    def __init__(self, bot_token=None, chat_id=None):
+    # Seconds send_message waits for Telegram before giving up
+    SEND_TIMEOUT = 10
+
+    def __init__(self, bot_token=None, chat_id=None, batch_window=None):
         self.bot_token = bot_token or os.getenv('TELEGRAM_BOT_TOKEN')
         self.chat_id = chat_id or os.getenv('TELEGRAM_CHAT_ID')
 
@@ -42,21 +135,32 @@ class TelegramAlerts:
             print("  Set TELEGRAM_BOT_TOKEN and TELEGRAM_CHAT_ID environment variables")
             print("  See setup instructions in telegram_alerts.py")
             self.bot = None
+            self._loop = None
+            self.batch = None
         else:
+            # One Bot (and its HTTP connection pool) on one long-lived event loop
             self.bot = Bot(token=self.bot_token)
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, name='telegram-loop', daemon=True).start()
+            # With batch_window (seconds), alert_* calls are coalesced into digests
+            self.batch = BatchedAlertQueue(self._send, self._loop, batch_window) if batch_window else None
+
+    async def _send(self, message):
+        """Send on the Bot's loop (raises TelegramError on failure)"""
+        await self.bot.send_message(
+            chat_id=self.chat_id,
+            text=message,
+            parse_mode='Markdown'
+        )
 
     async def send_message_async(self, message):
-        """Send message asynchronously"""
+        """Send message asynchronously (runs on the Bot's own loop, awaited from the caller's)"""
         if not self.bot:
             print("\u274c Cannot send message: Telegram not configured")
             return False
 
         try:
-            await self.bot.send_message(
-                chat_id=self.chat_id,
-                text=message,
-                parse_mode='Markdown'
-            )
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(self._send(message), self._loop))
             return True
         except TelegramError as e:
             print(f"\u274c Telegram error: {e}")
@@ -71,27 +175,36 @@ class TelegramAlerts:
             print("\u274c Cannot send message: Telegram not configured")
             return False
 
+        # Hand the coroutine to the background loop so the Bot is reused
+        future = asyncio.run_coroutine_threadsafe(self._send(message), self._loop)
         try:
-            # Run async function in sync context
-            # Create a fresh bot instance each time to avoid event loop issues
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            try:
-                bot = Bot(token=self.bot_token)
-                result = loop.run_until_complete(
-                    bot.send_message(
-                        chat_id=self.chat_id,
-                        text=message,
-                        parse_mode='Markdown'
-                    )
-                )
-                return True
-            finally:
-                loop.close()
+            future.result(timeout=self.SEND_TIMEOUT)
+            return True
         except Exception as e:
+            future.cancel()
             print(f"\u274c Error sending message: {e}")
             return False
 
+    def close(self):
+        """Send queued alerts, close the Bot's HTTP connections and stop the background loop"""
+        if not self.bot:
+            return
+        try:
+            if self.batch:
+                self.batch.flush(timeout=self.SEND_TIMEOUT)
+            asyncio.run_coroutine_threadsafe(self.bot.shutdown(), self._loop).result(timeout=self.SEND_TIMEOUT)
+        except Exception as e:
+            print(f"\u26a0 Error closing Telegram bot: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self.bot = self.batch = None  # Later calls (e.g. the atexit hook) are no-ops
+
+    def send_alert(self, message):
+        """Send an alert now, or queue it for the next digest when batching"""
+        if self.batch:
+            self.batch.put(message)
+            return True
+        return self.send_message(message)
+
     def alert_opportunities_found(self, count, top_opportunity=None):
         """Alert when new opportunities are found"""
         message = f"\U0001f3af *OPPORTUNITIES FOUND*\n\n"
@@ -105,7 +218,7 @@ class TelegramAlerts:
             message += f"\u2022 24h: {top_opportunity['change_24h']:+.2f}%\n"
 
         message += f"\nCheck scan report for full details."
-        return self.send_message(message)
+        return self.send_alert(message)
 
     def alert_catalyst_detected(self, count, top_catalyst=None):
         """Alert when fresh catalysts are detected"""
@@ -119,7 +232,7 @@ class TelegramAlerts:
             message += f"\u2022 Positive News: {top_catalyst['positive_count']}\n"
 
         message += f"\nCheck catalyst report for full details."
-        return self.send_message(message)
+        return self.send_alert(message)
 
     def alert_target_hit(self, coin_name, target_level, current_price, profit_pct):
         """Alert when T1/T2 target is hit"""
@@ -128,7 +241,7 @@ class TelegramAlerts:
         message += f"\u2022 Current Price: ${current_price:.4f} AUD\n"
         message += f"\u2022 Profit: {profit_pct:+.2f}%\n\n"
         message += f"Framework says: Exit {target_level} portion now."
-        return self.send_message(message)
+        return self.send_alert(message)
 
     def alert_stop_near(self, coin_name, current_price, stop_price, distance_pct):
         """Alert when price is near stop-loss"""
@@ -138,7 +251,7 @@ class TelegramAlerts:
         message += f"\u2022 Stop: ${stop_price:.4f} AUD\n"
         message += f"\u2022 Distance: {distance_pct:.1f}%\n\n"
         message += f"Monitor closely for potential exit."
-        return self.send_message(message)
+        return self.send_alert(message)
 
     def alert_regime_change(self, old_regime, new_regime, fng_value):
         """Alert when market regime changes significantly"""
@@ -155,7 +268,7 @@ class TelegramAlerts:
         else:  # BULL
             message += f"\U0001f680 Active trading mode (90+ score)."
 
-        return self.send_message(message)
+        return self.send_alert(message)
 
     def test_connection(self):
         """Test Telegram connection"""
@@ -170,13 +283,27 @@ class TelegramAlerts:
         return self.send_message(message)
 
 
+@functools.lru_cache(maxsize=1)
+def get_alerts():
+    """
+    Shared TelegramAlerts configured from the environment
+    The env vars are read and the Bot (plus its event loop thread) is
+    built once per process; every caller gets the same instance. Alerts
+    sent within half a second are coalesced, and anything still queued is
+    flushed when the interpreter exits.
+    """
+    alerts = TelegramAlerts(batch_window=0.5)
+    atexit.register(alerts.close)
+    return alerts
+
+
 if __name__ == "__main__":
     # Test the Telegram alerts
     print("=" * 80)
     print("TELEGRAM ALERTS TEST")
     print("=" * 80)
 
-    alerts = TelegramAlerts()
+    alerts = get_alerts()
 
     if alerts.bot:
         print("\nSending test message...")
@@ -14,59 +14,55 @@ Author: Manus AI
 Date: January 30, 2026
 """
 
-import threading
-import time
+import logging
 import os
+import sched
+import signal
 import sys
-from datetime import datetime
-from http.server import HTTPServer, BaseHTTPRequestHandler
-
-# ============================================================
-# STEP 1: Start health check server IMMEDIATELY
-# Koyeb needs a response on PORT within seconds or it fails
-# ============================================================
-
-class HealthCheckHandler(BaseHTTPRequestHandler):
-    """Simple HTTP handler for health checks (keeps Koyeb happy)"""
-
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header('Content-type', 'text/plain')
-        self.end_headers()
-        uptime = datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')
-        self.wfile.write(f"Apex Predator Trading Bot - ONLINE\nTime: {uptime}\n".encode())
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime, timedelta
 
-    def log_message(self, format, *args):
-        pass
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+# Add current directory to path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-def start_health_server():
-    """Start a simple HTTP server for health checks"""
-    port = int(os.environ.get("PORT", 8000))
-    server = HTTPServer(('0.0.0.0', port), HealthCheckHandler)
-    print(f"Health check server running on port {port}", flush=True)
-    server.serve_forever()
+from fast_json import dumps as json_dumps, loads as json_loads, response_json
+from file_io import atomic_write
+from health import AWST, now_awst, start_health_server
+from log_setup import setup_logging, stop_logging
 
+log = logging.getLogger(__name__)
 
-# Start health server FIRST in a background thread
-health_thread = threading.Thread(target=start_health_server, daemon=True)
-health_thread.start()
-print("Health check server started - bot is initializing...", flush=True)
+# Same cache directory as the scanner and engine
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
 
-# Give the health server a moment to bind
-time.sleep(1)
+# Keep-alive session for the bot's own requests (TLS handshake paid once)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
 
-# ============================================================
-# STEP 2: Now import the heavy modules and start the bot
-# ============================================================
+HOUR = 3600
+DAY = 24 * HOUR
 
-import schedule
+# Banner separator for job log records
+_SEP = "=" * 80
 
-# Add current directory to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from automated_scanner import AutomatedScanner
-from catalyst_detector import CatalystDetector
+def next_daily_run(hour, minute=0):
+    """Epoch seconds of the next hour:minute AWST"""
+    now = datetime.now(AWST)
+    run_at = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return run_at.timestamp()
 
 
 class TradingBot:
@@ -74,123 +70,348 @@ class TradingBot:
     Automated trading bot that runs scheduled tasks
     """
 
+    # F&G move (points) between readings that is reported as a regime shift
+    FNG_CHANGE_THRESHOLD = 10
+
+    # Shortest time a fetched F&G payload is reused (when it is due to update any moment)
+    FNG_MIN_CACHE_SECONDS = 60
+
+    # Seconds running jobs get to finish after a stop (inside Docker's 10s SIGTERM window)
+    SHUTDOWN_GRACE = 8
+
     def __init__(self):
-        self.scanner = AutomatedScanner(top_n=250, min_score=95)
-        self.catalyst_detector = CatalystDetector()
-
-        print("=" * 80, flush=True)
-        print("TRADING BOT V1.0 INITIALIZED", flush=True)
-        print("=" * 80, flush=True)
-        print(f"Start Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}", flush=True)
-        print("\nScheduled Tasks:", flush=True)
-        print("- Daily Market Scan: 8:00 AM AWST", flush=True)
-        print("- Hourly Catalyst Detection: Every hour", flush=True)
-        print("- Regime Monitoring: Every 6 hours", flush=True)
-        print("- Position Monitoring: Every 6 hours", flush=True)
-        print("=" * 80, flush=True)
+        # Scanner/detector pull in numpy and the indicator kernels;
+        # they're imported on first use so start-up stays light
+        self._scanner = None
+        self._catalyst_detector = None
+        # Jobs are queued at absolute epoch times; run() sleeps until the next one
+        self.scheduler = sched.scheduler(time.time, time.sleep)
+        # Set by stop() or SIGINT/SIGTERM; run() waits on it between jobs
+        self._stop = threading.Event()
+        self._stop_reason = "USER"
+        # Jobs run off the scheduler thread so a long scan can't hold up the others
+        self.pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='job')
+        self._in_flight = {}  # job name -> Future of its latest run
+        # Last run times and F&G reading, kept across restarts/redeploys
+        self.state_path = os.path.join(CACHE_DIR, 'bot_state.json')
+        self._state_lock = threading.Lock()
+        self.state = self._load_state()
+
+        log.info("%s\nTRADING BOT V1.0 INITIALIZED\n%s\nStart Time: %s\n"
+                 "\nScheduled Tasks:\n"
+                 "- Daily Market Scan: 8:00 AM AWST\n"
+                 "- Hourly Catalyst Detection: Every hour\n"
+                 "- Regime Monitoring: Every 6 hours\n"
+                 "- Position Monitoring: Every 6 hours\n%s",
+                 _SEP, _SEP, now_awst(), _SEP)
+
+    @property
+    def scanner(self):
+        """AutomatedScanner, imported and built on first use"""
+        if self._scanner is None:
+            from automated_scanner import AutomatedScanner
+            # Share regime_monitoring's daily F&G cache instead of fetching it again
+            self._scanner = AutomatedScanner(top_n=250, min_score=95, fng_source=self._fear_greed)
+        return self._scanner
+
+    @property
+    def catalyst_detector(self):
+        """CatalystDetector, imported and built on first use"""
+        if self._catalyst_detector is None:
+            from catalyst_detector import CatalystDetector
+            self._catalyst_detector = CatalystDetector()
+        return self._catalyst_detector
+
+    @staticmethod
+    def _log_trigger(title):
+        """Banner for a job run, as one log record"""
+        log.info("\n%s\n%s TRIGGERED\nTime: %s\n%s",
+                 _SEP, title, now_awst(), _SEP)
 
     def daily_market_scan(self):
-        """Run daily market scan"""
-        print("\n" + "=" * 80, flush=True)
-        print(f"DAILY MARKET SCAN TRIGGERED", flush=True)
-        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}", flush=True)
-        print("=" * 80, flush=True)
+        """Run daily market scan (True if it completed)"""
+        self._log_trigger("DAILY MARKET SCAN")
 
         try:
             opportunities = self.scanner.run_scan()
             if opportunities and len(opportunities) > 0:
-                print(f"\n\U0001f3af ALERT: {len(opportunities)} opportunities found!", flush=True)
-                print("Check scan report for details.", flush=True)
+                log.info("\n\U0001f3af ALERT: %d opportunities found!\nCheck scan report for details.",
+                         len(opportunities))
             else:
-                print("\nNo opportunities found today.", flush=True)
+                log.info("\nNo opportunities found today.")
+            return opportunities is not None  # None means the scan aborted
         except Exception as e:
-            print(f"\n\u274c Error during daily scan: {e}", flush=True)
+            log.error("\n\u274c Error during daily scan: %s", e)
+            return False
 
     def hourly_catalyst_detection(self):
-        """Run hourly catalyst detection"""
-        print("\n" + "=" * 80, flush=True)
-        print(f"HOURLY CATALYST DETECTION TRIGGERED", flush=True)
-        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}", flush=True)
-        print("=" * 80, flush=True)
+        """Run hourly catalyst detection (True if it completed)"""
+        self._log_trigger("HOURLY CATALYST DETECTION")
 
         try:
             catalysts = self.catalyst_detector.run_detection(hours=1, min_positive=2)
             if catalysts and len(catalysts) > 0:
-                print(f"\n\U0001f525 ALERT: {len(catalysts)} fresh catalysts detected!", flush=True)
-                print("Check catalyst report for details.", flush=True)
+                log.info("\n\U0001f525 ALERT: %d fresh catalysts detected!\nCheck catalyst report for details.",
+                         len(catalysts))
             else:
-                print("\nNo fresh catalysts detected this hour.", flush=True)
+                log.info("\nNo fresh catalysts detected this hour.")
+            return catalysts is not None  # None means detection aborted
         except Exception as e:
-            print(f"\n\u274c Error during catalyst detection: {e}", flush=True)
+            log.error("\n\u274c Error during catalyst detection: %s", e)
+            return False
 
     def regime_monitoring(self):
-        """Monitor market regime every 6 hours"""
-        print("\n" + "=" * 80, flush=True)
-        print(f"REGIME MONITORING TRIGGERED", flush=True)
-        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}", flush=True)
-        print("=" * 80, flush=True)
+        """Monitor market regime every 6 hours (True if it completed)"""
+        self._log_trigger("REGIME MONITORING")
 
         try:
-            import requests
-
             # Fetch Fear & Greed Index
-            response = requests.get("https://api.alternative.me/fng/?limit=1", timeout=10)
-            response.raise_for_status()
-            fng_data = response.json()
+            fng_data = self.fetch_regime_inputs().get('fng')
+            if fng_data is None:
+                return False  # Failure already logged by fetch_regime_inputs
             fng_value = int(fng_data['data'][0]['value'])
             fng_classification = fng_data['data'][0]['value_classification']
 
-            print(f"\nFear & Greed Index: {fng_value} ({fng_classification})", flush=True)
+            log.info("\nFear & Greed Index: %s (%s)", fng_value, fng_classification)
+
+            previous = self.state.get('last_fng_value')
+            if previous is not None and abs(fng_value - previous) > self.FNG_CHANGE_THRESHOLD:
+                log.info("\u26a0 Regime shift: Fear & Greed moved %s (%s) -> %s (%s)",
+                         previous, self.state.get('last_fng_class'), fng_value, fng_classification)
+            self._update_state(last_fng_value=fng_value, last_fng_class=fng_classification)
+            return True
 
         except Exception as e:
-            print(f"\n\u274c Error during regime monitoring: {e}", flush=True)
+            log.error("\n\u274c Error during regime monitoring: %s", e)
+            return False
+
+    def fetch_regime_inputs(self):
+        """
+        Every regime input in one go, as {name: payload}
+        Sources are fetched in parallel over SESSION, so the whole call takes
+        as long as the slowest source; providers with a multi-symbol form
+        (e.g. CoinGecko ids=a,b,c) should get one source entry, not one per symbol.
+        A source that fails is logged and left out instead of sinking the rest.
+        """
+        sources = {
+            'fng': self._fear_greed,
+        }
+        with ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix='regime') as pool:
+            futures = {name: pool.submit(fetch) for name, fetch in sources.items()}
+
+        inputs = {}
+        for name, future in futures.items():
+            try:
+                inputs[name] = future.result()
+            except Exception as e:
+                log.error("\n\u274c Could not fetch regime input %s: %s", name, e)
+        return inputs
+
+    def _fear_greed(self):
+        """
+        Latest Fear & Greed payload, cached on disk until the index next updates
+        Expiry comes from the payload itself (time_until_update, else the
+        reading's timestamp + 1 day), so a value fetched just before the
+        daily rollover is not kept as the new day's reading.
+        """
+        path = os.path.join(CACHE_DIR, 'fng.json')
+        try:
+            with open(path, 'rb') as f:
+                cached = json_loads(f.read())
+            if time.time() < cached['expires_at']:
+                return cached['payload']
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        response = SESSION.get("https://api.alternative.me/fng/?limit=1", timeout=10)
+        response.raise_for_status()
+        fng_data = response_json(response)
+
+        now = time.time()
+        latest = fng_data['data'][0]
+        if latest.get('time_until_update') is not None:
+            expires_at = now + int(latest['time_until_update'])
+        else:
+            expires_at = int(latest['timestamp']) + DAY
+        # Near the rollover the API can still serve the old reading; retry soon
+        expires_at = max(expires_at, now + self.FNG_MIN_CACHE_SECONDS)
+
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            atomic_write(path, json_dumps({'expires_at': expires_at, 'payload': fng_data}))
+        except OSError as e:
+            log.warning("  Could not cache Fear & Greed data: %s", e)
+        return fng_data
 
     def position_monitoring(self):
-        """Monitor open positions every 6 hours"""
-        print("\n" + "=" * 80, flush=True)
-        print(f"POSITION MONITORING TRIGGERED", flush=True)
-        print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}", flush=True)
-        print("=" * 80, flush=True)
+        """Monitor open positions every 6 hours (True if it completed)"""
+        self._log_trigger("POSITION MONITORING")
 
         try:
-            print("\nNo open positions to monitor.", flush=True)
+            log.info("\nNo open positions to monitor.")
+            return True
         except Exception as e:
-            print(f"\n\u274c Error during position monitoring: {e}", flush=True)
+            log.error("\n\u274c Error during position monitoring: %s", e)
+            return False
+
+    def _load_state(self):
+        """Persisted bot state ({} on first run or if unreadable)"""
+        try:
+            with open(self.state_path, 'rb') as f:
+                state = json_loads(f.read())
+        except (OSError, ValueError):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def _update_state(self, **changes):
+        """Merge changes into the state and persist it (atomic replace)"""
+        with self._state_lock:
+            self.state.update(changes)
+            try:
+                os.makedirs(CACHE_DIR, exist_ok=True)
+                atomic_write(self.state_path, json_dumps(self.state))
+            except OSError as e:
+                log.warning("  Could not save bot state: %s", e)
+
+    def _run_job(self, job):
+        """Run job and, if it reports success, record when it last ran"""
+        if job():
+            self._update_state(**{f"last_{job.__name__}": time.time()})
+
+    def _next_due(self, job, interval):
+        """When job is next due after its last recorded run (None if overdue or never run)"""
+        last = self.state.get(f"last_{job.__name__}")
+        if last is None or last + interval <= time.time():
+            return None
+        return last + interval
+
+    def _submit(self, job):
+        """Start job on the pool unless its previous run is still going"""
+        name = job.__name__
+        previous = self._in_flight.get(name)
+        if previous is not None and not previous.done():
+            log.warning("\n\u26a0 %s still running - skipping this run", name)
+            return
+        future = self.pool.submit(self._run_job, job)
+        future.add_done_callback(self._report_failure)
+        self._in_flight[name] = future
+
+    @staticmethod
+    def _report_failure(future):
+        """Log errors that escaped a job's own handling"""
+        if not future.cancelled() and future.exception() is not None:
+            log.error("\n\u274c Scheduled job failed: %s", future.exception())
+
+    def _schedule(self, run_at, job, interval):
+        """Run job at run_at (epoch seconds), then every interval seconds after it"""
+        def fire():
+            try:
+                self._submit(job)
+            finally:
+                # Next slot on the original grid (no drift), skipping any already missed
+                next_run = run_at + interval
+                now = time.time()
+                if next_run <= now:
+                    next_run += ((now - next_run) // interval + 1) * interval
+                self._schedule(next_run, job, interval)
+
+        self.scheduler.enterabs(run_at, 1, fire)
+
+    def stop(self, reason="USER"):
+        """Ask run() to return (safe from any thread or a signal handler)"""
+        self._stop_reason = reason
+        self._stop.set()
+
+    def _handle_signal(self, signum, frame):
+        # Only the first signal asks nicely: a second Ctrl-C raises
+        # KeyboardInterrupt and a second SIGTERM kills the process
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        self.stop("USER" if signum == signal.SIGINT else signal.Signals(signum).name)
+
+    def _shutdown(self):
+        """Drop queued runs and give running jobs SHUTDOWN_GRACE seconds to finish"""
+        running = [future for future in self._in_flight.values() if not future.done()]
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        try:
+            if running:
+                log.info("\nWaiting up to %ds for %d running job(s) - signal again to quit now",
+                         self.SHUTDOWN_GRACE, len(running))
+                running = wait(running, timeout=self.SHUTDOWN_GRACE).not_done
+        except KeyboardInterrupt:
+            pass  # Second Ctrl-C: stop waiting
+        log.info("\n\n%s\nBOT STOPPED BY %s\n%s\nStop Time: %s\n%s",
+                 _SEP, self._stop_reason, _SEP, now_awst(), _SEP)
+        if any(not future.done() for future in running):
+            # Pool threads are joined at interpreter exit, which would wait out the
+            # stuck job; flush the log and leave without them
+            stop_logging()
+            os._exit(1)
 
     def run(self):
         """Start the bot with scheduled tasks"""
-        # Schedule daily market scan at 8:00 AM AWST
-        schedule.every().day.at("08:00").do(self.daily_market_scan)
+        # Ctrl-C and the platform's SIGTERM wake the wait below immediately
+        signal.signal(signal.SIGINT, self._handle_signal)
+        signal.signal(signal.SIGTERM, self._handle_signal)
+
+        now = time.time()
 
-        # Schedule hourly catalyst detection
-        schedule.every().hour.do(self.hourly_catalyst_detection)
+        # Schedule daily market scan at 8:00 AM AWST
+        self._schedule(next_daily_run(8), self.daily_market_scan, DAY)
 
-        # Schedule regime monitoring every 6 hours
-        schedule.every(6).hours.do(self.regime_monitoring)
+        # Schedule hourly catalyst detection (keeping its cadence across restarts)
+        self._schedule(self._next_due(self.hourly_catalyst_detection, HOUR) or now + HOUR,
+                       self.hourly_catalyst_detection, HOUR)
 
-        # Schedule position monitoring every 6 hours
-        schedule.every(6).hours.do(self.position_monitoring)
+        # Schedule regime and position monitoring every 6 hours; each also runs
+        # now unless its last run (before a restart) is still current
+        initial_checks = []
+        for job in (self.regime_monitoring, self.position_monitoring):
+            due = self._next_due(job, 6 * HOUR)
+            if due is None:
+                initial_checks.append(job)
+                due = now + 6 * HOUR
+            self._schedule(due, job, 6 * HOUR)
 
-        print("\n\u2705 Bot started! Running scheduled tasks...", flush=True)
+        log.info("\n\u2705 Bot started! Running scheduled tasks...")
 
         # Run initial checks
-        print("\nRunning initial checks...", flush=True)
-        self.regime_monitoring()
-        self.position_monitoring()
+        if initial_checks:
+            log.info("\nRunning initial checks...")
+        else:
+            log.info("\nInitial checks ran recently - skipping until next due")
+        # On the pool, so the wait below (and a stop signal) isn't held up by them
+        for job in initial_checks:
+            self._submit(job)
 
-        # Keep the bot running
-        try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-        except KeyboardInterrupt:
-            print("\n\n" + "=" * 80, flush=True)
-            print("BOT STOPPED BY USER", flush=True)
-            print("=" * 80, flush=True)
-            print(f"Stop Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S AWST')}", flush=True)
-            print("=" * 80, flush=True)
+        # Keep the bot running: fire due jobs, then wait until the next one
+        # is due or a stop is requested
+        while not self._stop.is_set():
+            delay = self.scheduler.run(blocking=False)
+            self._stop.wait(delay)
 
+        self._shutdown()
 
-if __name__ == "__main__":
+
+def main(early_health_check=None):
+    """
+    Start logging, the health endpoint and the bot
+    With early_health_check the endpoint is up before the bot is built, so
+    the platform's start-up probe passes while it initialises. Defaults to
+    the EARLY_HEALTH_CHECK env var (on unless set to 0/false/no/off).
+    """
+    if early_health_check is None:
+        setting = os.environ.get('EARLY_HEALTH_CHECK', '1').strip().lower()
+        early_health_check = setting not in ('0', 'false', 'no', 'off')
+    setup_logging()
+    if early_health_check:
+        start_health_server()
+        log.info("Health check server started - bot is initializing...")
     bot = TradingBot()
+    if not early_health_check:
+        start_health_server()
     bot.run()
+
+
+if __name__ == "__main__":
+    main()